@@ -1,9 +1,31 @@
 """Cat capture and monitoring package."""
 
-from .config import Config
-from .detector import CatDetector
-from .recorder import CatRecorder
-from .tracker import CatTracker
-from .monitor import CatMonitor
+import importlib
+import os
+import sys
 
-__all__ = ["Config", "CatDetector", "CatRecorder", "CatTracker", "CatMonitor"]
\ No newline at end of file
+# The modules import each other as top-level modules (from config import
+# Config), so export those same modules rather than src.* duplicates that
+# would hold a second Config
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
+
+# Modules are imported on first attribute access so importing the
+# package doesn't pay for OpenCV, ultralytics or torch up front
+_LAZY_ATTRIBUTES = {
+    "Config": "config",
+    "CatDetector": "detector",
+    "CatRecorder": "recorder",
+    "CatTracker": "tracker",
+    "CatMonitor": "monitor",
+}
+
+__all__ = ["Config", "CatDetector", "CatRecorder", "CatTracker", "CatMonitor"]
+
+
+def __getattr__(name):
+    """Import the module providing an exported name on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
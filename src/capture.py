@@ -0,0 +1,120 @@
+"""Background frame capture module decoupling decode from processing."""
+
+import threading
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+
+
+class ThreadedCapture:
+    """Reads frames on a background thread, keeping only the latest one.
+
+    Exposes the subset of the cv2.VideoCapture interface used by the monitor,
+    so it can be swapped in transparently while decode overlaps inference.
+    """
+
+    def __init__(self, capture: cv2.VideoCapture, timeout: float = 1.0, reuse_buffers: bool = False):
+        """Start reading frames from an already opened capture.
+        
+        Args:
+            capture: Opened capture to read from
+            timeout: Seconds to wait for a new frame before giving up
+            reuse_buffers: Decode into three reused buffers instead of a new
+                array per frame; returned frames then stay valid only until
+                the next retrieve()
+        """
+        self.capture = capture
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.latest = None
+        
+        # Triple buffering: one buffer held by the consumer, one holding the
+        # latest frame and one being decoded into
+        self.buffers = [None, None, None] if reuse_buffers else None
+        self._latest_index = None
+        self._held_index = None
+        self._fresh = False  # Whether the last grab() got a new frame
+        self.new_frame = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self) -> None:
+        """Continuously read frames, overwriting the latest frame slot."""
+        index = None
+        while not self.stopped.is_set():
+            if self.buffers is None:
+                success, frame = self.capture.read()
+            else:
+                with self.lock:
+                    index = next(
+                        i for i in range(3) if i not in (self._latest_index, self._held_index)
+                    )
+                # Decode in place once the buffer has been allocated
+                buffer = self.buffers[index]
+                success, frame = self.capture.read(buffer) if buffer is not None else self.capture.read()
+                self.buffers[index] = frame
+            if not success:
+                break
+            with self.lock:
+                self.latest = frame
+                self._latest_index = index
+            self.new_frame.set()
+
+        # Wake up any consumer waiting for a frame
+        self.stopped.set()
+        self.new_frame.set()
+
+    def grab(self) -> bool:
+        """Wait for a frame newer than the last grabbed one.
+        
+        Returns False only once the reader has stopped on end of stream or
+        an error. A timeout without a new frame still returns True, and the
+        following retrieve() then reports that no frame is ready.
+        """
+        self._fresh = self.new_frame.wait(self.timeout)
+        if self.stopped.is_set():
+            return False
+        if self._fresh:
+            self.new_frame.clear()
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Return the latest frame read by the background thread.
+
+        The frame is handed over without copying. Without reused buffers every
+        read() allocates a new array, so the background thread never writes
+        into a frame that has already been returned. With reused buffers the
+        frame is not written to until the next retrieve(). Returns (False,
+        None) if the last grab() timed out without a new frame.
+        """
+        if not self._fresh:
+            return False, None
+        with self.lock:
+            frame = self.latest
+            self._held_index = self._latest_index
+        return frame is not None, frame
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """Wait for a new frame and return it, or (False, None) at end of stream."""
+        while self.grab():
+            if self._fresh:
+                return self.retrieve()
+        return False, None
+
+    def isOpened(self) -> bool:
+        """Check if the underlying capture is still delivering frames."""
+        return self.capture.isOpened() and not self.stopped.is_set()
+
+    def release(self) -> None:
+        """Stop the background thread and release the underlying capture.
+        
+        The capture is left unreleased if the reader is still blocked in
+        read(), since releasing it from another thread is unsafe in OpenCV.
+        """
+        self.stopped.set()
+        self.thread.join(self.timeout)
+        if self.thread.is_alive():
+            print("Warning: capture reader still blocked, not releasing the capture")
+            return
+        self.capture.release()
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Configuration settings for the cat detection application."""
 import os
 import json
+import logging
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class RecorderMode(Enum):
     """Recording modes for cat capture."""
@@ -21,38 +24,73 @@ class Config:
     # Camera settings
     WEBCAM_WIDTH = 1280
     WEBCAM_HEIGHT = 720
+    CAPTURE_FOURCC = "MJPG"  # Webcam pixel format, None keeps the driver default
+    CAPTURE_DOWNSCALE = 1.0  # Fraction of the webcam resolution to capture at
     
     # Detection settings
     CAT_MARGIN_PERCENT = 0.1
     CAT_ABSENCE_THRESHOLD = 0.5
-    
+    INFERENCE_IMGSZ = 416  # Model input size; smaller is faster but less accurate
+    DETECT_RESIZE = True  # Downscale frames to INFERENCE_IMGSZ before masking and detection
+    DETECTION_FPS = 0.0  # Max frames per second decoded for detection (0 = every frame)
+    DETECT_EVERY_N_FRAMES = 1  # Run the model on every Nth decoded frame, extrapolating the box in between (ignored with THREADED_DETECTION)
+    MOTION_THRESHOLD = 2.0  # Mean gray level change needed to run the model while no cat is seen (0 = always run, ignored with THREADED_DETECTION)
+    MOTION_MAX_SKIPS = 30  # Max detections skipped in a row on a static scene, to catch still cats
+
     # Mask settings
     USE_DETECTION_MASK = False
-    MASK_PATH = None
+    MASK_PATH = None  # None uses default_mask_path()
     MASK_OPACITY = 0.5
     
     # Output settings
     OUTPUT_DIR = "cat_captures"
     VIDEO_FORMAT = "avi"
     VIDEO_CODEC = "XVID"
+    VIDEO_ENCODER = None  # ffmpeg encoder for videos ("auto": first working of h264_nvenc, h264_qsv, libx264), None uses cv2.VideoWriter
     DEFAULT_FPS = 15.0
+    VIDEO_RATE_WINDOW = 1.0  # Seconds of frames buffered to measure a video's frame rate before encoding it
     PHOTO_FORMAT = "jpg"
     PHOTO_QUALITY = 95
+    DUPLICATE_HASH_DISTANCE = 0  # Skip recorded frames whose 64-bit dHash differs from the last kept one in fewer bits (0 = keep all)
+    PHOTO_ARCHIVE = False  # Store each photo session as a single .tar instead of a directory
     
     # Video source settings
     VIDEO_SOURCE_TYPE = VideoSourceType.WEBCAM
     VIDEO_SOURCE = 0  # Webcam index or RTMP URL
     RTMP_RECONNECT_ATTEMPTS = 3  # Number of times to attempt reconnection
     RTMP_RECONNECT_DELAY = 5     # Seconds to wait between reconnection attempts
+    RTMP_OPEN_TIMEOUT_MSEC = 10000  # Milliseconds to wait for the stream to open
+    RTMP_FFMPEG_OPTIONS = "fflags;nobuffer|flags;low_delay"
+    RTMP_HW_DECODER = None  # GStreamer decoder ("nvv4l2decoder", "vaapidecodebin"), None uses FFmpeg
+    CAPTURE_BUFFER_SIZE = 1  # Frames buffered by the capture driver
+    THREADED_CAPTURE = False  # Decode frames on a background thread (always done for RTMP via FFmpeg)
+    THREADED_DISPLAY = False  # Show frames and poll keys on a background thread
+    DISPLAY_FPS = 20.0  # Max frames per second shown in the window (0 = every processed frame)
+    THREADED_DETECTION = False  # Detect on a background thread, one frame behind capture; runs the model on every frame it takes, without motion gating or frame skipping
+    THREADED_RECORDING = False  # Encode and write recorded frames on a background thread
+    RECORDER_PIN_CORE = None  # CPU core to pin the recording thread to (Linux only), None lets it float
+    OPENCV_THREADS = None  # cv2.setNumThreads value (1 suits small frames), None keeps OpenCV's default
     
     # Model settings
-    YOLO_MODEL_PATH = "yolo11n.pt"
+    YOLO_MODEL_PATH = "yolo11n_ncnn_model"  # NCNN export of yolo11n.pt, see init.py
+    EXPORT_FORMAT = "ncnn"  # e.g. "openvino" (CPU INT8) or "engine" (TensorRT); update YOLO_MODEL_PATH to match
+    QUANTIZATION = "fp16"  # Exported precision: "fp32", "fp16" or "int8" (OpenVINO/TensorRT only)
+    EXPORT_INT8_DATA = "coco8.yaml"  # Dataset YAML with sample frames for INT8 calibration
+    USE_TENSORRT = False  # Export and prefer a TensorRT engine when a CUDA GPU is available
+    TENSORRT_ENGINE_PATH = "yolo11n.engine"
+    TORCH_COMPILE = False  # torch.compile the forward pass of .pt models
     
     # Recorder settings
     DEFAULT_RECORDER_MODE = RecorderMode.PHOTOS
     
     # Config file path
     CONFIG_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "user_config.json")
+    _loaded_mtime = None  # Modification time of the config file last synced with
+    
+    @classmethod
+    def default_mask_path(cls):
+        """Return the default mask path, next to the current output directory."""
+        return os.path.join(os.path.dirname(cls.OUTPUT_DIR), "masks", "detection_mask.png")
     
     @classmethod
     def save_user_config(cls):
@@ -68,42 +106,44 @@ class Config:
         try:
             with open(cls.CONFIG_FILE, 'w') as f:
                 json.dump(config_data, f, indent=4)
-                print(f"Configuration saved to {cls.CONFIG_FILE}")
+            cls._loaded_mtime = os.stat(cls.CONFIG_FILE).st_mtime_ns
+            logger.debug("Configuration saved to %s", cls.CONFIG_FILE)
         except Exception as e:
-            print(f"Error saving configuration: {e}")
+            logger.error("Error saving configuration: %s", e)
     
     @classmethod
     def load_user_config(cls):
         """Load user configuration settings from file."""
-        if not os.path.exists(cls.CONFIG_FILE):
-            print("No saved configuration found, using defaults")
+        try:
+            mtime = os.stat(cls.CONFIG_FILE).st_mtime_ns
+        except FileNotFoundError:
+            logger.debug("No saved configuration found, using defaults")
+            return
+        
+        # Settings are already in sync with the file, nothing to reload
+        if mtime == cls._loaded_mtime:
             return
         
         try:
-            with open(cls.CONFIG_FILE, 'r') as f:
-                config_data = json.load(f)
-                
-                if "USE_DETECTION_MASK" in config_data:
-                    cls.USE_DETECTION_MASK = config_data["USE_DETECTION_MASK"]
-                
-                if "MASK_PATH" in config_data and config_data["MASK_PATH"]:
-                    cls.MASK_PATH = config_data["MASK_PATH"]
-                
-                if "DEFAULT_RECORDER_MODE" in config_data:
-                    mode_str = config_data["DEFAULT_RECORDER_MODE"]
-                    cls.DEFAULT_RECORDER_MODE = (
-                        RecorderMode.VIDEO if mode_str == "video" else RecorderMode.PHOTOS
-                    )
-                
-                if "VIDEO_SOURCE_TYPE" in config_data:
-                    source_type = config_data["VIDEO_SOURCE_TYPE"]
-                    cls.VIDEO_SOURCE_TYPE = (
-                        VideoSourceType.RTMP if source_type == "rtmp" else VideoSourceType.WEBCAM
-                    )
-                
-                if "VIDEO_SOURCE" in config_data:
-                    cls.VIDEO_SOURCE = config_data["VIDEO_SOURCE"]
-                
-                print(f"Configuration loaded from {cls.CONFIG_FILE}")
+            with open(cls.CONFIG_FILE, 'rb') as f:
+                config_data = json.loads(f.read())
+            
+            cls.USE_DETECTION_MASK = config_data.get("USE_DETECTION_MASK", cls.USE_DETECTION_MASK)
+            cls.MASK_PATH = config_data.get("MASK_PATH") or cls.MASK_PATH
+            
+            mode_str = config_data.get("DEFAULT_RECORDER_MODE", cls.DEFAULT_RECORDER_MODE.value)
+            cls.DEFAULT_RECORDER_MODE = (
+                RecorderMode.VIDEO if mode_str == "video" else RecorderMode.PHOTOS
+            )
+            
+            source_type = config_data.get("VIDEO_SOURCE_TYPE", cls.VIDEO_SOURCE_TYPE.value)
+            cls.VIDEO_SOURCE_TYPE = (
+                VideoSourceType.RTMP if source_type == "rtmp" else VideoSourceType.WEBCAM
+            )
+            
+            cls.VIDEO_SOURCE = config_data.get("VIDEO_SOURCE", cls.VIDEO_SOURCE)
+            
+            cls._loaded_mtime = mtime
+            logger.debug("Configuration loaded from %s", cls.CONFIG_FILE)
         except Exception as e:
-            print(f"Error loading configuration: {e}")
\ No newline at end of file
+            logger.error("Error loading configuration: %s", e)
\ No newline at end of file
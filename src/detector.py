@@ -1,10 +1,14 @@
 """Cat detection module using YOLO model."""
 
 import os
-from typing import Tuple, Optional, Any
+from typing import Dict, Tuple, Optional, Any
 import numpy as np
 import cv2
-from ultralytics import YOLO
+from config import Config
+
+
+# Loaded YOLO models keyed by model path, shared by all CatDetector instances
+_MODEL_CACHE: Dict[str, Any] = {}
 
 
 class CatDetector:
@@ -13,14 +17,66 @@ class CatDetector:
     def __init__(self, model_path: str):
         """Initialize the cat detector with a YOLO model."""
         os.environ["YOLO_VERBOSE"] = "False"
-        self.model = YOLO(model_path)
+        self.model = _MODEL_CACHE.get(model_path)
+        is_new_model = self.model is None
+        if is_new_model:
+            # Deferred so importing this module does not pull in torch/ultralytics
+            from ultralytics import YOLO
+            self.model = _MODEL_CACHE[model_path] = YOLO(model_path)
+        # Resolve the class id once so the per-frame search is an int compare
+        self.cat_class_id = next(
+            (class_id for class_id, name in self.model.names.items() if name.lower() == 'cat'), None
+        )
+        if self.cat_class_id is None:
+            raise ValueError(f"Model {model_path} has no 'cat' class")
         self.mask = None
+        self._prepared_masks = {}  # Mask resized per frame shape, built on first use
+        self._detection_buf = None  # Reused masked frame passed to the model
+        self._resize_buf = None  # Reused downscaled frame passed to the model
+        self._box_scale = 1.0  # Detection frame size relative to the original frame
         self.fade_factor = 0.3  # Opacity for non-masked areas
         self.display_frame = None
         
+        # Run one inference up front so the first real frame isn't slowed
+        # down by kernel compilation and workspace allocation
+        if is_new_model:
+            self.warmup()
+            if Config.TORCH_COMPILE and model_path.endswith(".pt"):
+                self._compile_model(model_path)
+    
+    def warmup(self) -> None:
+        """Run a dummy inference pass to amortize first-frame latency."""
+        dummy_frame = np.zeros((Config.WEBCAM_HEIGHT, Config.WEBCAM_WIDTH, 3), dtype=np.uint8)
+        self._infer(self._resize_for_detection(dummy_frame))
+    
+    def _compile_model(self, model_path: str) -> None:
+        """Compile the PyTorch forward pass to fuse ops and skip per-op dispatch."""
+        import torch
+        
+        # Persist compiled kernels next to the model so restarts reuse them
+        cache_dir = os.path.splitext(os.path.abspath(model_path))[0] + "_compile_cache"
+        os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", cache_dir)
+        
+        # The predictor (and its backend) exists once warmup() has run
+        backend = self.model.predictor.model
+        original = backend.model
+        backend.model = torch.compile(original, mode="reduce-overhead", dynamic=False)
+        try:
+            # Trigger compilation now rather than on the first real frame
+            self.warmup()
+        except Exception as e:
+            print(f"Warning: torch.compile failed, using eager model: {e}")
+            backend.model = original
+    
+    def _infer(self, frame: np.ndarray) -> Any:
+        """Run the model on a frame at the configured inference size."""
+        return self.model(frame, imgsz=Config.INFERENCE_IMGSZ, verbose=False)
+        
     def set_mask(self, mask: Optional[np.ndarray]) -> None:
         """Set a binary mask for filtering detection area."""
         self.mask = mask
+        self._prepared_masks = {}
+        self._detection_buf = None
         
     def set_fade_factor(self, fade_factor: float) -> None:
         """Set the fade factor for non-masked areas."""
@@ -31,59 +87,96 @@ class CatDetector:
         mask = cv2.imread(mask_path, cv2.IMREAD_GRAYSCALE)
         if mask is not None:
             _, mask = cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY)
-            self.mask = mask
+            self.set_mask(mask)
         else:
             print(f"Warning: Failed to load mask from {mask_path}")
+    
+    def _mask_for(self, frame: np.ndarray) -> np.ndarray:
+        """Return the mask resized to this frame's shape, caching it for later frames."""
+        shape = frame.shape[:2]
+        mask = self._prepared_masks.get(shape)
+        if mask is None:
+            mask = self.mask
+            if mask.shape[:2] != shape:
+                mask = cv2.resize(mask, (shape[1], shape[0]))
+            mask = self._prepared_masks[shape] = np.ascontiguousarray(mask, dtype=np.uint8)
+        return mask
+    
+    def _resize_for_detection(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale a frame to the model input size, keeping its aspect ratio."""
+        scale = Config.INFERENCE_IMGSZ / max(frame.shape[:2])
+        if not Config.DETECT_RESIZE or scale >= 1.0:
+            self._box_scale = 1.0
+            return frame
+        
+        self._box_scale = scale
+        size = (round(frame.shape[1] * scale), round(frame.shape[0] * scale))
+        if self._resize_buf is None or self._resize_buf.shape[:2] != (size[1], size[0]):
+            self._resize_buf = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        return cv2.resize(frame, size, dst=self._resize_buf, interpolation=cv2.INTER_LINEAR)
+    
+    def update_display_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Build the display frame for a frame without running detection."""
+        if self.mask is not None:
+            # Create faded version for display (single uint8 scaling pass),
+            # restoring the masked region
+            self.display_frame = cv2.convertScaleAbs(frame, alpha=self.fade_factor, beta=0)
+            cv2.copyTo(frame, self._mask_for(frame), self.display_frame)
+        else:
+            # No mask, display the original frame as is (shared, not copied)
+            self.display_frame = frame
+        return self.display_frame
         
     def detect(self, frame: np.ndarray) -> Any:
         """Run object detection on a frame."""
-        self.display_frame = frame.copy()
+        self.update_display_frame(frame)
         
+        # Shrink the frame to the model input size first, so masking and the
+        # model's own preprocessing touch far fewer pixels
+        frame = self._resize_for_detection(frame)
         if self.mask is not None:
-            # Ensure mask size matches frame
-            if self.mask.shape[:2] != frame.shape[:2]:
-                self.mask = cv2.resize(self.mask, (frame.shape[1], frame.shape[0]))
+            # Pixels outside the mask are never written by the masked copy, so
+            # they stay zero across frames as long as the mask doesn't change
+            if self._detection_buf is None or self._detection_buf.shape != frame.shape:
+                self._detection_buf = np.zeros_like(frame)
             
-            # Create detection frame with masked areas
-            detection_frame = np.zeros_like(frame)
-            mask_3ch = np.stack([self.mask] * 3, axis=2)
-            
-            # Apply the mask - only copy pixels where mask is non-zero
-            np.copyto(detection_frame, frame, where=mask_3ch > 0)
-            
-            # Create faded version for display
-            faded_area = (frame.astype(np.float32) * self.fade_factor).astype(np.uint8)
-            np.copyto(self.display_frame, faded_area, where=mask_3ch == 0)
+            # Create detection frame with masked areas - only keep pixels where
+            # mask is non-zero, writing into the reused detection buffer
+            mask = self._mask_for(frame)
+            detection_frame = cv2.bitwise_and(frame, frame, dst=self._detection_buf, mask=mask)
             
             # Run detection on the masked frame
-            return self.model(detection_frame, verbose=False)
+            return self._infer(detection_frame)
         else:
-            # No mask, use original frame
-            return self.model(frame, verbose=False)
+            return self._infer(frame)
     
     def get_display_frame(self) -> np.ndarray:
-        """Get the frame with faded non-masked areas for display."""
+        """Get the frame with faded non-masked areas for display.
+        
+        Without a mask this is the frame passed to detect() itself, so drawing
+        on it draws on that frame.
+        """
         if self.display_frame is None:
             return np.zeros((1, 1, 3), dtype=np.uint8)
         return self.display_frame
     
     def get_cat_box(self, results: Any) -> Optional[Tuple[int, int, int, int]]:
         """Extract cat bounding box from detection results."""
-        for r in results:
-            boxes = r.boxes
-            for i, class_id in enumerate(boxes.cls):
-                if self.model.names[int(class_id)].lower() == 'cat':
-                    box = boxes.xyxy[i].cpu().numpy().astype(int)
-                    return tuple(box)  # (x1, y1, x2, y2)
-        return None
+        return self.get_cat_box_with_confidence(results)[0]
     
     def get_cat_box_with_confidence(self, results: Any) -> Tuple[Optional[Tuple[int, int, int, int]], float]:
-        """Extract cat bounding box and confidence from detection results."""
+        """Extract cat bounding box and confidence from detection results.
+        
+        The box is in the coordinates of the frame passed to detect().
+        """
         for r in results:
-            boxes = r.boxes
-            for i, class_id in enumerate(boxes.cls):
-                if self.model.names[int(class_id)].lower() == 'cat':
-                    box = boxes.xyxy[i].cpu().numpy().astype(int)
-                    conf = float(boxes.conf[i].cpu().numpy())
-                    return tuple(box), conf
+            # Select cat rows where the results live (possibly the GPU) and
+            # read back a single row; rows are x1, y1, x2, y2, [id,] conf, cls
+            data = r.boxes.data
+            cats = data[data[:, -1] == self.cat_class_id]
+            if len(cats):
+                # Rows are sorted by confidence, so the first cat is the best one
+                row = cats[0].tolist()
+                box = (int(v / self._box_scale) for v in row[:4])  # Undo the detection downscale
+                return tuple(box), float(row[-2])  # (x1, y1, x2, y2)
         return None, 0.0
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Display module showing annotated frames from a background thread."""
+
+import queue
+import threading
+import cv2
+import numpy as np
+
+
+class FrameDisplay:
+    """Shows frames and polls key presses on a dedicated GUI thread.
+
+    Frames go through a single slot: a frame that is still waiting when the
+    next one arrives is dropped, so a slow display never stalls the caller.
+    """
+
+    def __init__(self, window_name: str):
+        """Start the display thread for the given window."""
+        self.window_name = window_name
+        self.frames = queue.Queue(maxsize=1)
+        self.keys = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self) -> None:
+        """Show queued frames until the shutdown sentinel arrives."""
+        while True:
+            frame = self.frames.get()
+            try:
+                if frame is None:
+                    break
+                cv2.imshow(self.window_name, frame)
+                key = cv2.waitKey(1)
+                if key != -1:
+                    self.keys.put(key)
+            finally:
+                self.frames.task_done()
+
+    def show(self, frame: np.ndarray) -> None:
+        """Queue a frame for display, replacing one not shown yet.
+        
+        Must be called from a single thread, which is then the only one
+        putting frames into the slot.
+        """
+        try:
+            self.frames.get_nowait()
+            self.frames.task_done()
+        except queue.Empty:
+            pass
+        self.frames.put_nowait(frame)
+
+    def poll_key(self) -> int:
+        """Return the next pressed key, or -1 if none is pending."""
+        try:
+            return self.keys.get_nowait()
+        except queue.Empty:
+            return -1
+
+    def wait_idle(self) -> None:
+        """Wait until all queued frames are shown and the GUI thread is idle.
+
+        Call this before opening other windows from the calling thread, so
+        that only one thread talks to the GUI backend at a time.
+        """
+        self.frames.join()
+
+    def stop(self) -> None:
+        """Stop the display thread after showing the queued frames."""
+        self.frames.put(None)
+        self.thread.join()
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Background detection module overlapping inference with capture."""
+
+import queue
+import threading
+from typing import Optional, Tuple
+import numpy as np
+
+from detector import CatDetector
+
+
+# (frame, display_frame, cat_box, confidence) for one processed frame;
+# display_frame is None when no mask was applied
+Detection = Tuple[np.ndarray, Optional[np.ndarray], Optional[Tuple[int, int, int, int]], float]
+
+
+class DetectionWorker:
+    """Runs cat detection on a background thread.
+
+    Frames are double buffered: one frame can wait while another is being
+    detected, and frames submitted while both slots are busy are dropped.
+    Results are therefore one frame behind the submitting thread.
+    """
+
+    def __init__(self, detector: CatDetector):
+        """Start the detection thread for the given detector."""
+        self.detector = detector
+        self.frames = queue.Queue(maxsize=1)
+        self.results = queue.Queue()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self) -> None:
+        """Detect cats in queued frames until the shutdown sentinel arrives."""
+        while True:
+            frame = self.frames.get()
+            try:
+                if frame is None:
+                    break
+                results = self.detector.detect(frame)
+                cat_box, confidence = self.detector.get_cat_box_with_confidence(results)
+                display_frame = (
+                    self.detector.get_display_frame() if self.detector.mask is not None else None
+                )
+                self.results.put((frame, display_frame, cat_box, confidence))
+            finally:
+                self.frames.task_done()
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Queue a frame for detection, returning False if it was dropped."""
+        try:
+            self.frames.put_nowait(frame)
+            return True
+        except queue.Full:
+            return False
+
+    def poll(self) -> Optional[Detection]:
+        """Return the next finished detection, or None if none is ready."""
+        try:
+            return self.results.get_nowait()
+        except queue.Empty:
+            return None
+
+    def wait_idle(self) -> None:
+        """Wait until all queued frames are detected.
+
+        Call this before changing the detector's mask from another thread.
+        """
+        self.frames.join()
+
+    def stop(self) -> None:
+        """Stop the detection thread after finishing the queued frames."""
+        self.frames.put(None)
+        self.thread.join()
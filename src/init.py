@@ -1,13 +1,37 @@
-import torch
+import os
 from ultralytics import YOLO
+from config import Config
+
+# Exports are written next to the weights, so keep both in the repo root
+# whatever the current directory
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'yolo11n.pt')
+
+def precision_args():
+    # Export arguments for the configured precision, FP32 being the fallback
+    int8 = Config.QUANTIZATION == "int8"
+    return {
+        "half": Config.QUANTIZATION == "fp16",
+        "int8": int8,
+        "data": Config.EXPORT_INT8_DATA if int8 else None,
+    }
 
 def export_model():
     # Load YOLOv11n model
-    model = YOLO('yolo11n.pt')  # Load YOLOv11n model
+    model = YOLO(WEIGHTS_PATH)  # Load YOLOv11n model
     
-    # Export the model to NCNN format
-    model.export(format='ncnn')
-    print("YOLOv11n model exported to NCNN format successfully")
+    # Export the model to NCNN format (or the configured one), at reduced precision
+    path = model.export(format=Config.EXPORT_FORMAT, imgsz=Config.INFERENCE_IMGSZ, **precision_args())
+    print(f"YOLOv11n model exported to {Config.EXPORT_FORMAT} format successfully: {path}")
+
+def export_engine():
+    # Export YOLOv11n to a TensorRT engine for CUDA GPUs
+    model = YOLO(WEIGHTS_PATH)
+    path = model.export(format='engine', imgsz=Config.INFERENCE_IMGSZ, **precision_args())
+    print(f"YOLOv11n model exported to TensorRT format successfully: {path}")
+
+def cuda_available():
+    import torch
+    return torch.cuda.is_available()
 
 if __name__ == "__main__":
     export_model()
\ No newline at end of file
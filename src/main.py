@@ -2,15 +2,17 @@
 """Main entry point for the cat detection application."""
 
 import argparse
+import logging
 import os
 import sys
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add this directory to the path so modules share one import of config
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.monitor import CatMonitor
-from src.config import RecorderMode, Config, VideoSourceType
-from src.init import export_model
+from config import RecorderMode, Config, VideoSourceType
+
+# Marker written inside the exported model directory once export succeeded
+MODEL_SENTINEL = ".mikancita_model_ok"
 
 
 def parse_args():
@@ -31,7 +33,7 @@ def parse_args():
     parser.add_argument(
         "--mask-path",
         type=str,
-        help="Path to a previously saved mask file (png format)"
+        help="Path to a previously saved mask file (png, or npy for a raw mask)"
     )
     parser.add_argument(
         "--rtmp",
@@ -48,27 +50,59 @@ def parse_args():
 
 def check_and_initialize_model():
     """Check if the model exists and initialize it if needed."""
-    model_path = Config.YOLO_MODEL_PATH
-    ncnn_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "yolo11n_ncnn_model")
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    
+    # Prefer a TensorRT engine on GPU machines, exporting it on first use
+    if Config.USE_TENSORRT:
+        engine_path = os.path.join(root_dir, Config.TENSORRT_ENGINE_PATH)
+        if not os.path.exists(engine_path):
+            # Imported lazily: checking for CUDA and exporting pull in torch
+            from init import cuda_available, export_engine
+            if cuda_available():
+                print("Exporting TensorRT engine...")
+                export_engine()
+        if os.path.exists(engine_path):
+            Config.YOLO_MODEL_PATH = engine_path
+            return
+        print("TensorRT engine not available, using the NCNN model")
+    
+    ncnn_dir = os.path.join(root_dir, Config.YOLO_MODEL_PATH)
+    # Load the model that is checked here, not one in the current directory
+    Config.YOLO_MODEL_PATH = ncnn_dir
+    sentinel = os.path.join(ncnn_dir, MODEL_SENTINEL)
     
-    if not os.path.exists(model_path) or not os.path.exists(ncnn_dir):
+    # A single stat covers the common case of an already exported model
+    if os.path.exists(sentinel):
+        return
+    
+    # Only the exported NCNN model is needed at runtime
+    if not os.path.exists(ncnn_dir):
         print("Model not found. Initializing model...")
+        # Imported lazily: exporting pulls in torch and ultralytics
+        from init import export_model
         export_model()
         print("Model initialization complete.")
+    
+    # Removing the model directory removes the sentinel along with it
+    if os.path.isdir(ncnn_dir):
+        open(sentinel, "w").close()
 
 
 def main():
     """Run the cat detection application."""
+    # Parse arguments first so --help returns without touching the model
+    args = parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Load user configuration
     Config.load_user_config()
     
     # Check and initialize the model if needed
     check_and_initialize_model()
     
-    args = parse_args()
-    
-    # Command line args override saved config
-    mode = RecorderMode.VIDEO if args.mode == "video" else RecorderMode.PHOTOS
+    # Command line args override saved config (choices match the enum values)
+    mode = RecorderMode(args.mode)
     
     # Set mask configuration
     if args.mask:
@@ -90,6 +124,10 @@ def main():
     # Save the configuration
     Config.save_user_config()
     
+    # Imported here so argument errors and --help don't load OpenCV and the
+    # rest of the monitoring stack
+    from monitor import CatMonitor
+    
     # Initialize and run the monitor
     monitor = CatMonitor(recorder_mode=mode)
     monitor.run()
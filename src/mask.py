@@ -3,6 +3,7 @@
 import os
 import cv2
 import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Tuple, Optional
 
 
@@ -16,62 +17,60 @@ class MaskManager:
         self.points = []
         self.temp_point = None
         self.reference_frame = None
+        
+        # Buffers reused across GUI ticks while editing a mask
+        self._display_buf = None
+        self._overlay_buf = None
+        self._blend_buf = None
+        self._overlay_rect = None
+        self._text_layer = None
+        self._text_mask = None
+        self._text_rect = None
+        self._drawn_rect = None
+        self._mask_dirty = False
+        self._mask_nonempty = False
+        self._view_dirty = False
+        
+        # Masks are written on a background thread so saving doesn't block the UI
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = None
+        self._loaded = None  # (filepath, mtime, mask) of the last mask loaded
     
     def create_interactive_mask(self, frame: np.ndarray) -> Optional[np.ndarray]:
         """Launch an interactive tool to create a mask."""
         frame_size = (frame.shape[1], frame.shape[0])
         self.reference_frame = frame.copy()
+        self.reference_frame.flags.writeable = False  # Drawing goes to the display buffer only
         self.mask = np.zeros((frame_size[1], frame_size[0]), dtype=np.uint8)
         
+        # Allocate the render buffers once instead of on every GUI tick
+        self._display_buf = np.empty_like(frame)
+        self._drawn_rect = (0, 0, frame_size[0], frame_size[1])
+        self._render_instructions(frame)
+        self._mask_dirty = False
+        self._mask_nonempty = False
+        self._view_dirty = True
+        
         window_name = "Create Detection Mask - Press 'c' to clear, 's' to save, 'q' to quit"
         cv2.namedWindow(window_name)
         cv2.setMouseCallback(window_name, self._on_mouse)
         
         while True:
-            display_frame = self.reference_frame.copy()
-            
-            # Draw the current polygon points
-            if len(self.points) > 0:
-                # Draw all points
-                for point in self.points:
-                    cv2.circle(display_frame, point, 5, (0, 255, 0), -1)
-                
-                # Draw lines between points
-                for i in range(len(self.points) - 1):
-                    cv2.line(display_frame, self.points[i], self.points[i+1], (0, 255, 0), 2)
-                
-                # Draw line from last point to first point if we have at least 3 points
-                if len(self.points) >= 3:
-                    cv2.line(display_frame, self.points[-1], self.points[0], (0, 255, 0), 2)
-                
-                # Draw line from last point to current mouse position
-                if self.temp_point is not None:
-                    cv2.line(display_frame, self.points[-1], self.temp_point, (0, 255, 0), 2)
-            
-            # Show mask overlay
-            if self.mask is not None and np.any(self.mask):
-                mask_overlay = np.zeros_like(display_frame)
-                mask_overlay[self.mask > 0] = [0, 200, 0]  # Green color where mask is active
-                alpha = 0.3  # transparency factor
-                display_frame = cv2.addWeighted(display_frame, 1, mask_overlay, alpha, 0)
-            
-            # Show instructions
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            cv2.putText(display_frame, "Click to add points, double-click to complete polygon", 
-                       (10, 30), font, 0.7, (255, 255, 255), 2)
-            cv2.putText(display_frame, "Press 'c' to clear, 's' to save, 'q' to quit", 
-                       (10, 60), font, 0.7, (255, 255, 255), 2)
+            # Only rebuild the view after an edit, idle ticks just poll keys
+            if self._view_dirty:
+                self._render_view(window_name)
             
-            cv2.imshow(window_name, display_frame)
-            
-            # Handle key presses
-            key = cv2.waitKey(1) & 0xFF
+            # Handle key presses, waiting about one Windows timer tick
+            key = cv2.waitKey(15) & 0xFF
             if key == ord('q'):
                 self.mask = None
                 break
             elif key == ord('c'):
                 self.points = []
-                self.mask = np.zeros((frame_size[1], frame_size[0]), dtype=np.uint8)
+                self.mask.fill(0)  # Clear in place rather than reallocating
+                self._mask_dirty = True
+                self._mask_nonempty = False
+                self._view_dirty = True
             elif key == ord('s'):
                 if len(self.points) >= 3:
                     self._complete_polygon()
@@ -82,14 +81,99 @@ class MaskManager:
         cv2.destroyWindow(window_name)
         return self.mask
     
+    def _render_view(self, window_name: str) -> None:
+        """Draw the polygon, mask overlay and instructions, then show them."""
+        display_frame = self._display_buf
+        
+        # Only the area drawn over last time differs from the reference frame
+        x, y, w, h = self._drawn_rect
+        np.copyto(display_frame[y:y+h, x:x+w], self.reference_frame[y:y+h, x:x+w])
+        
+        # Draw the current polygon points
+        if len(self.points) > 0:
+            # Draw all points
+            for point in self.points:
+                cv2.circle(display_frame, point, 5, (0, 255, 0), -1)
+            
+            # Draw lines between points in one call, closing the polygon
+            # back to the first point if we have at least 3 points
+            pts = np.array(self.points, dtype=np.int32).reshape(-1, 1, 2)
+            cv2.polylines(display_frame, [pts], len(self.points) >= 3, (0, 255, 0), 2)
+            
+            # Draw line from last point to current mouse position
+            if self.temp_point is not None:
+                cv2.line(display_frame, self.points[-1], self.temp_point, (0, 255, 0), 2)
+        
+        # Show mask overlay, blending only inside the mask's bounding box
+        if self._mask_nonempty:
+            if self._mask_dirty:
+                self._prepare_overlay()
+            x, y, w, h = self._overlay_rect
+            roi = display_frame[y:y+h, x:x+w]
+            alpha = 0.3  # transparency factor
+            cv2.addWeighted(roi, 1, self._overlay_buf, alpha, 0, dst=self._blend_buf)
+            cv2.copyTo(self._blend_buf, self.mask[y:y+h, x:x+w], roi)
+        
+        # Show instructions by blitting the pre-rendered text sprite
+        x, y, w, h = self._text_rect
+        cv2.copyTo(self._text_layer, self._text_mask, display_frame[y:y+h, x:x+w])
+        
+        cv2.imshow(window_name, display_frame)
+        self._drawn_rect = self._drawn_area()
+        self._view_dirty = False
+    
+    def _drawn_area(self) -> Tuple[int, int, int, int]:
+        """Get the bounding box of everything drawn over the reference frame."""
+        rects = [self._text_rect]
+        if self.points:
+            points = self.points + ([self.temp_point] if self.temp_point is not None else [])
+            x, y, w, h = cv2.boundingRect(np.array(points, dtype=np.int32))
+            pad = 6  # Point radius plus line thickness
+            rects.append((x - pad, y - pad, w + 2 * pad, h + 2 * pad))
+        if self._mask_nonempty:
+            rects.append(self._overlay_rect)
+        
+        frame_h, frame_w = self._display_buf.shape[:2]
+        x1 = max(0, min(r[0] for r in rects))
+        y1 = max(0, min(r[1] for r in rects))
+        x2 = min(frame_w, max(r[0] + r[2] for r in rects))
+        y2 = min(frame_h, max(r[1] + r[3] for r in rects))
+        return x1, y1, x2 - x1, y2 - y1
+    
+    def _prepare_overlay(self) -> None:
+        """Cache the mask's bounding box and a solid overlay color for it."""
+        x, y, w, h = cv2.boundingRect(self.mask)
+        self._overlay_rect = (x, y, w, h)
+        self._overlay_buf = np.full((h, w, 3), (0, 200, 0), dtype=np.uint8)  # Green color where mask is active
+        self._blend_buf = np.empty_like(self._overlay_buf)
+        self._mask_dirty = False
+    
+    def _render_instructions(self, frame: np.ndarray) -> None:
+        """Render the static instructions once into a sprite and its mask."""
+        text_layer = np.zeros_like(frame)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        cv2.putText(text_layer, "Click to add points, double-click to complete polygon", 
+                   (10, 30), font, 0.7, (255, 255, 255), 2)
+        cv2.putText(text_layer, "Press 'c' to clear, 's' to save, 'q' to quit", 
+                   (10, 60), font, 0.7, (255, 255, 255), 2)
+        
+        # Keep only the text's bounding box, copied out of the full-size layer
+        text_mask = cv2.cvtColor(text_layer, cv2.COLOR_BGR2GRAY)
+        x, y, w, h = cv2.boundingRect(text_mask)
+        self._text_rect = (x, y, w, h)
+        self._text_layer = text_layer[y:y+h, x:x+w].copy()
+        self._text_mask = text_mask[y:y+h, x:x+w].copy()
+    
     def _on_mouse(self, event, x, y, flags, param):
         """Mouse callback function for interactive mask creation."""
         if event == cv2.EVENT_MOUSEMOVE:
             if len(self.points) > 0:
                 self.temp_point = (x, y)
+                self._view_dirty = True
         
         elif event == cv2.EVENT_LBUTTONDOWN:
             self.points.append((x, y))
+            self._view_dirty = True
         
         elif event == cv2.EVENT_LBUTTONDBLCLK:
             if len(self.points) >= 3:
@@ -100,23 +184,72 @@ class MaskManager:
         if len(self.points) >= 3:
             points_array = np.array([self.points], dtype=np.int32)
             cv2.fillPoly(self.mask, points_array, 255)
+            self._mask_dirty = True
+            self._mask_nonempty = True
+            self._view_dirty = True
     
-    def save_mask(self, mask: np.ndarray, filepath: str) -> bool:
-        """Save a mask to disk."""
+    def save_mask(self, mask: np.ndarray, filepath: str) -> Future:
+        """Save a mask to disk in the background.
+        
+        Masks saved to a .npy path are stored raw, skipping PNG encoding.
+        
+        Returns:
+            Future resolving to True if the mask was saved
+        """
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        return cv2.imwrite(filepath, mask)
+        self._pending_save = self._save_pool.submit(self._write_mask, mask.copy(), filepath)
+        return self._pending_save
+    
+    def _write_mask(self, mask: np.ndarray, filepath: str) -> bool:
+        """Write a mask to a temporary file, then move it into place."""
+        root, ext = os.path.splitext(filepath)
+        tmp_path = f"{root}.tmp{ext}"
+        try:
+            if ext.lower() == ".npy":
+                np.save(tmp_path, mask)
+            elif not cv2.imwrite(tmp_path, mask):
+                print(f"Failed to save mask to {filepath}")
+                return False
+            
+            # Replace atomically so readers never see a partially written mask
+            os.replace(tmp_path, filepath)
+        except Exception as e:
+            print(f"Error saving mask to {filepath}: {e}")
+            return False
+        
+        print(f"Saved detection mask to {filepath}")
+        return True
     
     def load_mask(self, filepath: str) -> Optional[np.ndarray]:
         """Load a mask from disk."""
-        if not os.path.exists(filepath):
+        # Make sure a mask being saved in the background is on disk first
+        if self._pending_save is not None:
+            self._pending_save.result()
+        
+        try:
+            mtime = os.stat(filepath).st_mtime_ns
+        except FileNotFoundError:
             print(f"Mask file not found: {filepath}")
             return None
         
-        mask = cv2.imread(filepath, cv2.IMREAD_GRAYSCALE)
-        if mask is None:
-            print(f"Failed to load mask from {filepath}")
-            return None
+        # Reuse the decoded mask while the file is unchanged
+        if self._loaded is not None and self._loaded[:2] == (filepath, mtime):
+            return self._loaded[2]
+        
+        # Raw masks are memory-mapped and already binary
+        if filepath.lower().endswith(".npy"):
+            mask = np.load(filepath, mmap_mode='r')
+        else:
+            mask = cv2.imread(filepath, cv2.IMREAD_GRAYSCALE)
+            if mask is None:
+                print(f"Failed to load mask from {filepath}")
+                return None
+            
+            # Ensure it's binary, in place since the decoded image is ours
+            cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY, dst=mask)
+            
+            # The mask is shared with later loads, so it must not be modified
+            mask.flags.writeable = False
         
-        # Ensure it's binary
-        _, mask = cv2.threshold(mask, 127, 255, cv2.THRESH_BINARY)
+        self._loaded = (filepath, mtime, mask)
         return mask
\ No newline at end of file
@@ -11,6 +11,16 @@ from detector import CatDetector
 from recorder import CatRecorder
 from tracker import CatTracker
 from mask import MaskManager
+from capture import ThreadedCapture
+from display import FrameDisplay
+from inference import DetectionWorker
+
+
+# GStreamer elements that decode H.264 in hardware and convert to raw video
+GSTREAMER_DECODERS = {
+    "nvv4l2decoder": "nvv4l2decoder ! nvvidconv ! video/x-raw,format=BGRx ! videoconvert",
+    "vaapidecodebin": "vaapidecodebin ! videoconvert",
+}
 
 
 class CatMonitor:
@@ -22,16 +32,50 @@ class CatMonitor:
         Args:
             recorder_mode: Mode for recording (VIDEO or PHOTOS)
         """
-        self.cap = self._setup_video_source()
+        if Config.OPENCV_THREADS is not None:
+            cv2.setNumThreads(Config.OPENCV_THREADS)
+        self.cap = self._start_capture(self._setup_video_source())
         self.detector = CatDetector(Config.YOLO_MODEL_PATH)
+        self.detection_worker = DetectionWorker(self.detector) if Config.THREADED_DETECTION else None
+        if self.detection_worker is not None and (Config.MOTION_THRESHOLD > 0 or Config.DETECT_EVERY_N_FRAMES > 1):
+            # The worker owns the detector, skipping frames would need its display state
+            print("Threaded detection runs the model on every frame, MOTION_THRESHOLD and DETECT_EVERY_N_FRAMES are ignored")
         self.recorder = CatRecorder(
             Config.OUTPUT_DIR, 
             Config.VIDEO_FORMAT, 
             Config.VIDEO_CODEC,
-            mode=recorder_mode
+            mode=recorder_mode,
+            threaded=Config.THREADED_RECORDING
         )
         self.tracker = CatTracker(Config.CAT_ABSENCE_THRESHOLD)
         self.mask_manager = MaskManager()
+        self.display = FrameDisplay("Cat Detection") if Config.THREADED_DISPLAY else None
+        
+        # Last detected cat box and its per-frame motion, used to extrapolate
+        # the box on frames between detections
+        self._frame_idx = 0
+        self._last_box = None
+        self._box_velocity = None
+        self._last_confidence = 0.0
+        
+        # Thumbnail of the last frame the model ran on while no cat was seen,
+        # used to skip the model while the scene stays still; the buffers are
+        # reused and the reference swapped with the scratch thumbnail
+        self._motion_small = np.empty((45, 80, 3), dtype=np.uint8)
+        self._motion_thumb = np.empty((45, 80), dtype=np.uint8)
+        self._motion_ref = np.empty((45, 80), dtype=np.uint8)
+        self._motion_ref_valid = False
+        self._static_frames = 0
+        
+        # Earliest time the next frame may be shown, capping the display rate
+        self._show_interval = 1.0 / Config.DISPLAY_FPS if Config.DISPLAY_FPS > 0 else 0.0
+        self._next_show = 0.0
+        
+        # Status overlays and their text masks, rendered once per status shown
+        self._overlay_cache: Dict[Tuple[Any, ...], Tuple[np.ndarray, np.ndarray]] = {}
+        
+        # Mask options dialogs, rendered once with and without the saved mask options
+        self._mask_options_cache: Dict[bool, np.ndarray] = {}
         
         # Load or create mask if needed
         if Config.USE_DETECTION_MASK:
@@ -44,13 +88,9 @@ class CatMonitor:
     
     def _setup_mask(self) -> None:
         """Load or create a detection mask."""
-        # Create mask directory if needed
-        mask_dir = os.path.join(os.path.dirname(Config.OUTPUT_DIR), "masks")
-        os.makedirs(mask_dir, exist_ok=True)
-        
-        # Set default mask path if not specified
+        # Set default mask path if not specified (saving creates its directory)
         if Config.MASK_PATH is None:
-            Config.MASK_PATH = os.path.join(mask_dir, "detection_mask.png")
+            Config.MASK_PATH = Config.default_mask_path()
         
         # Try to load existing mask
         if os.path.exists(Config.MASK_PATH):
@@ -63,11 +103,12 @@ class CatMonitor:
         # Create new mask if loading failed
         print("Creating new detection mask...")
         _, frame = self.cap.read()
-        if frame is not None:
+        if frame is None:
+            print("Could not read a frame to draw the mask on, proceeding without a mask")
+        else:
             mask = self.mask_manager.create_interactive_mask(frame)
             if mask is not None:
-                if self.mask_manager.save_mask(mask, Config.MASK_PATH):
-                    print(f"Saved detection mask to {Config.MASK_PATH}")
+                self.mask_manager.save_mask(mask, Config.MASK_PATH)
                 self.detector.set_mask(mask)
             else:
                 print("Mask creation canceled, proceeding without a mask")
@@ -83,6 +124,13 @@ class CatMonitor:
             
             if self.recorder.is_recording():
                 self.recorder.stop()
+            self.recorder.close()
+            
+            if self.detection_worker is not None:
+                self.detection_worker.stop()
+            
+            if self.display is not None:
+                self.display.stop()
             
             self.cap.release()
             cv2.destroyAllWindows()
@@ -90,11 +138,26 @@ class CatMonitor:
     def _main_loop(self) -> None:
         """Main processing loop."""
         reconnect_attempts = 0
+        detect_interval = 1.0 / Config.DETECTION_FPS if Config.DETECTION_FPS > 0 else 0.0
+        last_detect = None
+        frame = None
         
+        # Bind methods used on every iteration to locals, skipping repeated
+        # attribute lookups in the hot loop (capture methods are rebound on
+        # reconnect)
+        grab, retrieve = self.cap.grab, self.cap.retrieve
+        monotonic = time.monotonic
+        handle_key_press = self._handle_key_press
+        detector = self.detector
+        tracker_update = self.tracker.update
+        handle_events = self._handle_events
+        show_frame = self._show_frame
+        detect_every = Config.DETECT_EVERY_N_FRAMES
+
         while True:
-            # Get and process frame
-            success, frame = self.cap.read()
-            
+            # Grab every frame to keep the source flowing, decode only when needed
+            success = grab()
+
             # Handle potential stream disconnection
             if not success:
                 # For RTMP, try to reconnect
@@ -105,8 +168,11 @@ class CatMonitor:
                     # Release current capture and try to reconnect
                     self.cap.release()
                     time.sleep(Config.RTMP_RECONNECT_DELAY)
-                    self.cap = cv2.VideoCapture(Config.VIDEO_SOURCE)
+                    self.cap = self._start_capture(
+                        self._open_capture(Config.VIDEO_SOURCE, Config.VIDEO_SOURCE_TYPE)
+                    )
                     
+                    grab, retrieve = self.cap.grab, self.cap.retrieve
                     if self.cap.isOpened():
                         print("Successfully reconnected to stream")
                         reconnect_attempts = 0
@@ -119,24 +185,123 @@ class CatMonitor:
                 # Reset reconnection attempts on successful frame read
                 reconnect_attempts = 0
 
-            # Detect cats and handle events
-            results = self.detector.detect(frame)
-            cat_box, confidence = self.detector.get_cat_box_with_confidence(results)
-            events = self.tracker.update(cat_box is not None)
-            self._handle_events(events, frame, cat_box, confidence)
+            # Skip decoding frames that arrive faster than the detection rate
+            now = monotonic()
+            if last_detect is not None and now - last_detect < detect_interval:
+                if frame is not None and handle_key_press(frame):
+                    break
+                continue
+
+            success, retrieved = retrieve()
+            if not success:
+                # No new frame yet (the source stalled), keep the window
+                # responding so 'q' still quits
+                if frame is not None and handle_key_press(frame):
+                    break
+                continue
+            frame = retrieved
+            last_detect = now
+
+            # Detect cats, or hand the frame to the worker and take whichever
+            # detection it finished last
+            if self.detection_worker is not None:
+                self.detection_worker.submit(frame)
+                detection = self.detection_worker.poll()
+                if detection is None:
+                    if handle_key_press(frame):
+                        break
+                    continue
+                detected_frame, display_frame, cat_box, confidence = detection
+            else:
+                detected_frame = frame
+                steps = self._frame_idx % detect_every
+                self._frame_idx += 1
+                if steps == 0 and self._should_detect(frame):
+                    results = detector.detect(frame)
+                    cat_box, confidence = detector.get_cat_box_with_confidence(results)
+                    self._update_box_motion(cat_box, confidence)
+                    display_frame = detector.get_display_frame()
+                elif steps == 0:
+                    # Nothing moved since the model last saw no cat
+                    cat_box, confidence = None, 0.0
+                    display_frame = detector.update_display_frame(frame)
+                else:
+                    # Skip the model, moving the last box along its recent motion
+                    cat_box = self._extrapolate_box(steps, frame.shape)
+                    confidence = self._last_confidence
+                    display_frame = detector.update_display_frame(frame)
+                if detector.mask is None:
+                    display_frame = None
+            
+            # Handle events for the frame the detection ran on
+            appeared, disappeared, duration, away_since = tracker_update(cat_box is not None, now)
+            handle_events(appeared, disappeared, duration, detected_frame, cat_box, confidence, away_since)
             
             # Display frame and handle user input
-            self._show_frame(results, frame)
-            if self._handle_key_press(frame):
+            show_frame(display_frame if display_frame is not None else detected_frame, cat_box)
+            if handle_key_press(frame):
                 break
     
+    def _should_detect(self, frame: np.ndarray) -> bool:
+        """Decide whether to run the model, skipping it while an empty scene is still."""
+        if Config.MOTION_THRESHOLD <= 0 or self.tracker.is_detected():
+            self._motion_ref_valid = False
+            return True
+        
+        # Compare a tiny grayscale thumbnail against the one the model last
+        # ran on, so slow changes still add up to a detection. Area averaging
+        # keeps sensor noise from looking like motion.
+        thumbnail = self._motion_thumb
+        cv2.resize(frame, (80, 45), dst=self._motion_small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._motion_small, cv2.COLOR_BGR2GRAY, dst=thumbnail)
+        if (
+            self._motion_ref_valid
+            and self._static_frames < Config.MOTION_MAX_SKIPS
+            and cv2.norm(thumbnail, self._motion_ref, cv2.NORM_L1) / thumbnail.size < Config.MOTION_THRESHOLD
+        ):
+            self._static_frames += 1
+            return False
+        
+        self._motion_ref, self._motion_thumb = thumbnail, self._motion_ref
+        self._motion_ref_valid = True
+        self._static_frames = 0
+        return True
+    
+    def _update_box_motion(self, cat_box: Optional[Tuple[int, int, int, int]], confidence: float) -> None:
+        """Record a detected box and its per-frame motion since the last detection."""
+        if cat_box is not None and self._last_box is not None:
+            # Track the box center only, so the extrapolated box keeps its size
+            n = Config.DETECT_EVERY_N_FRAMES
+            self._box_velocity = (
+                ((cat_box[0] + cat_box[2]) - (self._last_box[0] + self._last_box[2])) / (2 * n),
+                ((cat_box[1] + cat_box[3]) - (self._last_box[1] + self._last_box[3])) / (2 * n),
+            )
+        else:
+            self._box_velocity = None
+        self._last_box = cat_box
+        self._last_confidence = confidence
+    
+    def _extrapolate_box(self, steps: int, frame_shape: Tuple[int, ...]) -> Optional[Tuple[int, int, int, int]]:
+        """Predict the cat box a number of frames after the last detection."""
+        if self._last_box is None or self._box_velocity is None:
+            return self._last_box
+        
+        # Keep the moved box inside the frame so it always crops to something
+        x1, y1, x2, y2 = self._last_box
+        frame_h, frame_w = frame_shape[:2]
+        dx = min(max(round(self._box_velocity[0] * steps), -x1), frame_w - x2)
+        dy = min(max(round(self._box_velocity[1] * steps), -y1), frame_h - y2)
+        return x1 + dx, y1 + dy, x2 + dx, y2 + dy
+    
     def _handle_key_press(self, frame: np.ndarray) -> bool:
         """Handle key press events for controlling the application.
         
         Returns:
             True if application should exit, False otherwise
         """
-        key = cv2.waitKey(1)
+        # pollKey processes GUI events without the waitKey sleep, which is
+        # rounded up to the ~15 ms timer granularity on Windows
+        key = self.display.poll_key() if self.display is not None else cv2.pollKey()
         if key == ord("q"):
             # Exit if 'q' is pressed
             return True
@@ -144,7 +309,11 @@ class CatMonitor:
             # Toggle mode if 'm' is pressed (only between recordings)
             self._toggle_recorder_mode()
         elif key == ord("k"):
-            # Toggle mask mode
+            # Toggle mask mode, keeping the GUI and detector to this thread meanwhile
+            if self.display is not None:
+                self.display.wait_idle()
+            if self.detection_worker is not None:
+                self.detection_worker.wait_idle()
             self._toggle_mask_mode(frame)
         
         return False
@@ -172,13 +341,9 @@ class CatMonitor:
             print("Cannot change mask while recording is in progress")
             return
         
-        # Create mask directory if needed
-        mask_dir = os.path.join(os.path.dirname(Config.OUTPUT_DIR), "masks")
-        os.makedirs(mask_dir, exist_ok=True)
-        
-        # Set default mask path if not specified
+        # Set default mask path if not specified (saving creates its directory)
         if Config.MASK_PATH is None:
-            Config.MASK_PATH = os.path.join(mask_dir, "detection_mask.png")
+            Config.MASK_PATH = Config.default_mask_path()
 
         # Toggle mask state
         if self.detector.mask is None:
@@ -193,19 +358,12 @@ class CatMonitor:
     def _show_mask_options(self, mask_path: str, frame: np.ndarray) -> None:
         """Show mask options dialog and handle selection."""
         options_window = "Mask Options"
-        options_frame = np.zeros((300, 600, 3), dtype=np.uint8)
-        
-        # Add options text
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        cv2.putText(options_frame, "Mask Options:", (20, 40), font, 0.8, (255, 255, 255), 2)
-        cv2.putText(options_frame, "c - Create new mask", (40, 100), font, 0.7, (255, 255, 255), 2)
         
         # Only show load option if a mask file exists
-        if os.path.exists(mask_path):
-            cv2.putText(options_frame, "l - Load saved mask", (40, 150), font, 0.7, (255, 255, 255), 2)
-            cv2.putText(options_frame, "r - Remove saved mask", (40, 200), font, 0.7, (255, 255, 255), 2)
-        
-        cv2.putText(options_frame, "q - Cancel", (40, 250), font, 0.7, (255, 255, 255), 2)
+        has_saved_mask = os.path.exists(mask_path)
+        options_frame = self._mask_options_cache.get(has_saved_mask)
+        if options_frame is None:
+            options_frame = self._mask_options_cache[has_saved_mask] = self._render_mask_options(has_saved_mask)
         
         # Show options window
         cv2.imshow(options_window, options_frame)
@@ -218,7 +376,7 @@ class CatMonitor:
                 cv2.destroyWindow(options_window)
                 self._create_new_mask(frame)
                 break
-            elif key == ord('l') and os.path.exists(mask_path):
+            elif key == ord('l') and has_saved_mask:
                 # Load saved mask
                 mask = self.mask_manager.load_mask(mask_path)
                 if mask is not None:
@@ -228,7 +386,7 @@ class CatMonitor:
                     Config.save_user_config()
                 cv2.destroyWindow(options_window)
                 break
-            elif key == ord('r') and os.path.exists(mask_path):
+            elif key == ord('r') and has_saved_mask:
                 # Remove saved mask
                 try:
                     os.remove(mask_path)
@@ -244,15 +402,31 @@ class CatMonitor:
                 cv2.destroyWindow(options_window)
                 break
     
+    def _render_mask_options(self, has_saved_mask: bool) -> np.ndarray:
+        """Render the mask options dialog."""
+        options_frame = np.zeros((300, 600, 3), dtype=np.uint8)
+        
+        # Add options text
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        cv2.putText(options_frame, "Mask Options:", (20, 40), font, 0.8, (255, 255, 255), 2)
+        cv2.putText(options_frame, "c - Create new mask", (40, 100), font, 0.7, (255, 255, 255), 2)
+        
+        if has_saved_mask:
+            cv2.putText(options_frame, "l - Load saved mask", (40, 150), font, 0.7, (255, 255, 255), 2)
+            cv2.putText(options_frame, "r - Remove saved mask", (40, 200), font, 0.7, (255, 255, 255), 2)
+        
+        cv2.putText(options_frame, "q - Cancel", (40, 250), font, 0.7, (255, 255, 255), 2)
+        return options_frame
+    
     def _create_new_mask(self, frame: np.ndarray) -> None:
         """Create a new detection mask using the current frame as reference."""
-        # Create a new mask
-        mask = self.mask_manager.create_interactive_mask(frame)
+        # Use a fresh frame as reference, the last one shown has the overlay drawn on it
+        success, reference_frame = self.cap.read()
+        mask = self.mask_manager.create_interactive_mask(reference_frame if success else frame)
         
         if mask is not None:
-            # Save the mask
-            if self.mask_manager.save_mask(mask, Config.MASK_PATH):
-                print(f"Saved detection mask to {Config.MASK_PATH}")
+            # Save the mask in the background
+            self.mask_manager.save_mask(mask, Config.MASK_PATH)
             
             # Set the mask in the detector
             self.detector.set_mask(mask)
@@ -270,48 +444,58 @@ class CatMonitor:
         if duration is not None:
             print(f"Cat was on camera for {duration:.2f} seconds")
     
-    def _show_frame(self, results: Any, frame: np.ndarray) -> None:
-        """Display the frame with detection results."""
-        # Get the appropriate display frame based on mask status
-        if self.detector.mask is not None:
-            display_frame = self.detector.get_display_frame()
-            annotated_frame = results[0].plot(img=display_frame)
-        else:
-            annotated_frame = results[0].plot()
+    def _show_frame(self, frame: np.ndarray, cat_box: Optional[Tuple[int, int, int, int]]) -> None:
+        """Display the frame with the cat's bounding box, drawing in place."""
+        # Skip drawing and showing frames faster than the display rate
+        now = time.monotonic()
+        if now < self._next_show:
+            return
+        self._next_show = now + self._show_interval
+        
+        if cat_box is not None:
+            x1, y1, x2, y2 = cat_box
+            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
         
         # Add overlay text with status information
-        self._add_status_overlay(annotated_frame)
+        self._add_status_overlay(frame)
         
-        cv2.imshow("Cat Detection", annotated_frame)
+        if self.display is not None:
+            self.display.show(frame)
+        else:
+            cv2.imshow("Cat Detection", frame)
     
     def _add_status_overlay(self, frame: np.ndarray) -> None:
         """Add status text overlay to the frame."""
-        # Add mode indicator
-        mode_text = f"Mode: {'PHOTOS' if self.recorder.mode == RecorderMode.PHOTOS else 'VIDEO'}"
-        cv2.putText(
-            frame, mode_text, (10, 30),
-            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
-        )
+        status = (self.recorder.mode, self.detector.mask is not None, Config.VIDEO_SOURCE_TYPE)
+        cached = self._overlay_cache.get(status)
+        if cached is None:
+            cached = self._overlay_cache[status] = self._render_status_overlay(*status)
+        overlay, overlay_mask = cached
         
-        # Add mask status
-        mask_text = "Mask: ON" if self.detector.mask is not None else "Mask: OFF"
-        cv2.putText(
-            frame, mask_text, (10, 60),
-            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
-        )
+        # Blit only the text pixels, clipped to frames smaller than the overlay
+        h = min(overlay.shape[0], frame.shape[0])
+        w = min(overlay.shape[1], frame.shape[1])
+        cv2.copyTo(overlay[:h, :w], overlay_mask[:h, :w], frame[:h, :w])
+    
+    def _render_status_overlay(self, mode: RecorderMode, mask_enabled: bool, source_type: VideoSourceType) -> Tuple[np.ndarray, np.ndarray]:
+        """Render the status text once onto a small overlay and its mask."""
+        mode_text = f"Mode: {'PHOTOS' if mode == RecorderMode.PHOTOS else 'VIDEO'}"
+        mask_text = "Mask: ON" if mask_enabled else "Mask: OFF"
+        source_text = f"Source: {'RTMP' if source_type == VideoSourceType.RTMP else 'Webcam'}"
+        lines = [
+            (mode_text, 30, 1),
+            (mask_text, 60, 1),
+            (source_text, 90, 1),
+            ("q: quit, m: change mode, k: edit mask", 120, 0.7),
+        ]
         
-        # Add source type
-        source_type = "RTMP" if Config.VIDEO_SOURCE_TYPE == VideoSourceType.RTMP else "Webcam"
-        cv2.putText(
-            frame, f"Source: {source_type}", (10, 90),
-            cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
-        )
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        width = 10 + max(cv2.getTextSize(text, font, scale, 2)[0][0] for text, _, scale in lines)
+        overlay = np.zeros((130, width, 3), dtype=np.uint8)
+        for text, y, scale in lines:
+            cv2.putText(overlay, text, (10, y), font, scale, (0, 255, 0), 2)
         
-        # Add key help
-        cv2.putText(
-            frame, "q: quit, m: change mode, k: edit mask", (10, 120),
-            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2
-        )
+        return overlay, cv2.cvtColor(overlay, cv2.COLOR_BGR2GRAY)
     
     def _setup_video_source(self) -> cv2.VideoCapture:
         """Initialize and configure the video source (webcam or RTMP)."""
@@ -325,20 +509,23 @@ class CatMonitor:
             print(f"Connecting to RTMP stream: {source}")
         
         # Initialize video capture
-        cap = cv2.VideoCapture(source)
+        cap = self._open_capture(source, source_type)
         
         # Configure properties based on source type
         if source_type == VideoSourceType.WEBCAM:
-            # For webcams, set resolution and FPS
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, Config.WEBCAM_WIDTH)
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.WEBCAM_HEIGHT)
+            # For webcams, request a compressed pixel format first (it limits
+            # the available resolutions), then set resolution and FPS
+            if Config.CAPTURE_FOURCC:
+                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*Config.CAPTURE_FOURCC))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, int(Config.WEBCAM_WIDTH * Config.CAPTURE_DOWNSCALE))
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, int(Config.WEBCAM_HEIGHT * Config.CAPTURE_DOWNSCALE))
             cap.set(cv2.CAP_PROP_FPS, Config.DEFAULT_FPS)
         else:
             # For RTMP, handle potential connection issues
             attempts = 0
             while not cap.isOpened() and attempts < Config.RTMP_RECONNECT_ATTEMPTS:
                 print(f"Failed to connect to RTMP stream, retrying ({attempts+1}/{Config.RTMP_RECONNECT_ATTEMPTS})...")
-                cap = cv2.VideoCapture(source)
+                cap = self._open_capture(source, source_type)
                 attempts += 1
                 time.sleep(Config.RTMP_RECONNECT_DELAY)
             
@@ -354,10 +541,76 @@ class CatMonitor:
         
         return cap
     
-    def _handle_events(self, events: Dict[str, Any], frame: np.ndarray, cat_box: Optional[Tuple[int, int, int, int]], confidence: float = 0.0) -> None:
-        """Handle cat tracking events."""
+    def _start_capture(self, cap: cv2.VideoCapture) -> Any:
+        """Move frame decoding to a background thread if configured."""
+        if not cap.isOpened():
+            return cap
+        
+        # Frames can be decoded into reused buffers unless another thread
+        # keeps them after the loop has moved on to the next frame
+        reuse_buffers = not (Config.THREADED_DISPLAY or Config.THREADED_DETECTION)
+        if Config.THREADED_CAPTURE:
+            return ThreadedCapture(cap, reuse_buffers=reuse_buffers)
+        
+        # FFmpeg ignores the buffer size for streams, so frames would pile up
+        # whenever detection is slower than the stream; keep only the latest
+        # one instead (a GStreamer appsink already drops stale frames)
+        if Config.VIDEO_SOURCE_TYPE == VideoSourceType.RTMP and cap.getBackendName() != "GSTREAMER":
+            return ThreadedCapture(cap, reuse_buffers=reuse_buffers)
+        
+        # Some webcam backends (e.g. MSMF on Windows) ignore the driver buffer
+        # size, so frames may lag; THREADED_CAPTURE keeps reads fresh there.
+        # Stream backends always report 0 and are handled above
+        if (Config.VIDEO_SOURCE_TYPE == VideoSourceType.WEBCAM
+                and cap.get(cv2.CAP_PROP_BUFFERSIZE) != Config.CAPTURE_BUFFER_SIZE):
+            print(
+                "Capture backend ignores the buffer size, frames may lag; "
+                "set THREADED_CAPTURE to read them in the background"
+            )
+        return cap
+    
+    def _open_capture(self, source: Any, source_type: VideoSourceType) -> cv2.VideoCapture:
+        """Open a video capture configured to always return the freshest frame."""
+        if source_type == VideoSourceType.RTMP and Config.RTMP_HW_DECODER:
+            cap = self._open_gstreamer_capture(source, Config.RTMP_HW_DECODER)
+            if cap.isOpened():
+                return cap
+            print("Hardware decoding pipeline failed to open, falling back to FFmpeg")
+        
+        if source_type == VideoSourceType.RTMP:
+            # Ask FFmpeg not to buffer the stream before handing frames over
+            os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", Config.RTMP_FFMPEG_OPTIONS)
+            cap = cv2.VideoCapture(
+                source,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, Config.RTMP_OPEN_TIMEOUT_MSEC]
+            )
+        else:
+            cap = cv2.VideoCapture(source)
+        
+        # Keep a single buffered frame so reads never return stale frames
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, Config.CAPTURE_BUFFER_SIZE)
+        return cap
+    
+    def _open_gstreamer_capture(self, url: str, decoder: str) -> cv2.VideoCapture:
+        """Open an RTMP stream through GStreamer with hardware H.264 decoding."""
+        decode_chain = GSTREAMER_DECODERS.get(decoder, f"{decoder} ! videoconvert")
+        
+        # The appsink keeps only the newest frame, dropping older ones
+        pipeline = (
+            f"rtmpsrc location={url} ! flvdemux ! h264parse ! {decode_chain} ! "
+            "video/x-raw,format=BGR ! appsink drop=1 max-buffers=1"
+        )
+        return cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+    
+    def _handle_events(self, appeared: bool, disappeared: bool, duration: Optional[float], frame: np.ndarray, cat_box: Optional[Tuple[int, int, int, int]], confidence: float = 0.0, away_since: Optional[float] = None) -> None:
+        """Handle cat tracking events.
+        
+        away_since is the time.monotonic() value when a disappeared cat was
+        last seen, as reported by the tracker.
+        """
         # Handle cat appearance
-        if events["appeared"]:
+        if appeared:
             print("Cat detected!")
             self.recorder.start()
         
@@ -366,12 +619,13 @@ class CatMonitor:
             self.recorder.add_frame(frame, cat_box, confidence)
         
         # Handle cat disappearance
-        if events["disappeared"]:
-            print(f"Cat was on camera for {events['duration']:.2f} seconds")
+        if disappeared:
+            print(f"Cat was on camera for {duration:.2f} seconds")
             
             # Set recorder end time to when cat first disappeared
-            if away_since := self.tracker.get_away_since():
-                self.recorder.set_end_time(away_since)
+            if away_since is not None:
+                # The tracker runs on the monotonic clock, the recorder on wall time
+                self.recorder.set_end_time(time.time() - (time.monotonic() - away_since))
             
             # Stop recording
             self.recorder.stop()
\ No newline at end of file
@@ -1,126 +1,415 @@
 """Recording module for capturing cat videos and photos."""
 
+import io
+import json
 import os
+import queue
+import subprocess
+import tarfile
+import threading
 import time
 import cv2
 import numpy as np
 import shutil
 import yaml
-from typing import Tuple, List, Optional, Dict, Any
+from array import array
+from functools import lru_cache
+from typing import Tuple, List, Optional, Dict, Any, Union
 from datetime import datetime
 from config import Config, RecorderMode
 
+# libyaml's C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+# libjpeg-turbo's SIMD encoder for JPEG photos, cv2.imwrite otherwise
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_encoders() -> str:
+    """List the encoders of the installed ffmpeg, or nothing if it is missing."""
+    try:
+        return subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_encoder_works(name: str) -> bool:
+    """Check that an encoder can start, by encoding one blank frame with it.
+    
+    Hardware encoders are listed by any ffmpeg build that supports them,
+    but fail to initialize on machines without the matching GPU.
+    """
+    try:
+        return subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "lavfi", "-i", "nullsrc=s=64x64",
+             "-frames:v", "1", "-pix_fmt", "yuv420p", "-c:v", name, "-f", "null", "-"],
+            capture_output=True, timeout=10
+        ).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def _resolve_ffmpeg_encoder(setting: Optional[str]) -> Optional[str]:
+    """Pick the ffmpeg encoder to use, or None to fall back to cv2.VideoWriter."""
+    if not setting:
+        return None
+    encoders = _ffmpeg_encoders()
+    candidates = ("h264_nvenc", "h264_qsv", "libx264") if setting == "auto" else (setting,)
+    return next(
+        (name for name in candidates if f" {name} " in encoders and _ffmpeg_encoder_works(name)), None
+    )
+
+
+class _FfmpegWriter:
+    """Pipes raw BGR frames into an ffmpeg encoder, like a cv2.VideoWriter."""
+    
+    def __init__(self, path: str, encoder: str, fps: float, frame_size: Tuple[int, int]):
+        """Start an ffmpeg process encoding frames of the given size to path."""
+        width, height = frame_size
+        command = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "bgr24", "-s", f"{width}x{height}", "-r", f"{fps}", "-i", "-",
+            # yuv420p needs even dimensions, pad crops with odd ones
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", "-c:v", encoder,
+        ]
+        if encoder.endswith("_nvenc"):
+            command += ["-preset", "p1"]
+        elif encoder.endswith("_qsv"):
+            command += ["-preset", "veryfast"]
+        command.append(path)
+        
+        self.encoder = encoder
+        self.dead = False  # Set once ffmpeg stopped accepting frames
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+    
+    def write(self, frame: np.ndarray) -> None:
+        """Send one frame to the encoder, dropping it if ffmpeg has exited."""
+        if self.dead:
+            return
+        try:
+            # Hand the frame's memory over as is, without a bytes copy
+            self.process.stdin.write(np.ascontiguousarray(frame).data)
+        except OSError:
+            # BrokenPipeError included: ffmpeg exited, drop the remaining frames
+            self.dead = True
+            print(f"Warning: ffmpeg exited with code {self.process.wait()} while encoding with {self.encoder}, "
+                  "dropping the remaining frames")
+    
+    def release(self) -> None:
+        """Finish encoding and wait for ffmpeg to exit."""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if self.process.wait() != 0 and not self.dead:
+            print(f"Warning: ffmpeg exited with code {self.process.returncode} while encoding with {self.encoder}")
+
 
 class CatRecorder:
     """Records and saves videos or photos of detected cats."""
     
-    def __init__(self, output_dir: str, video_format: str, codec: str, mode: RecorderMode = Config.DEFAULT_RECORDER_MODE):
-        """Initialize the cat recorder."""
+    __slots__ = (
+        "output_dir", "video_format", "codec", "fourcc", "margin_percent", "mode", "recording",
+        "writer", "cv_writer", "writer_fps", "pending_frames", "frame_size", "resize_buf", "session_path", "part_path", "confidence_path",
+        "confidence_log", "archive", "start_time", "end_time", "frame_count", "last_hash",
+        "dropped_frames", "queue_dropped_frames", "confidences", "confidence_mean", "confidence_m2", "confidence_min",
+        "confidence_max", "confidence_max_index", "largest_frame_size", "largest_frame_index",
+        "timestamp", "metadata", "photo_name", "photo_ext", "photo_params", "_store_frame",
+        "frame_queue", "thread",
+    )
+    
+    def __init__(self, output_dir: str, video_format: str, codec: str, mode: RecorderMode = Config.DEFAULT_RECORDER_MODE, threaded: bool = False):
+        """Initialize the cat recorder.
+        
+        With threaded set, frames are resized, encoded and written on a
+        background thread fed through a bounded queue.
+        """
         self.output_dir = output_dir
         self.video_format = video_format
         self.codec = codec
+        self.fourcc = cv2.VideoWriter_fourcc(*codec)
+        self.margin_percent = Config.CAT_MARGIN_PERCENT
         self.mode = mode
-        self.state = {
-            "is_recording": False,
-            "frames": [],
-            "frame_size": None,
-            "session_path": None,
-            "start_time": None,
-            "end_time": None,
-            "frame_count": 0,
-            "confidences": [],
-            "frame_sizes": [],
-            "timestamp": None,
-            "metadata": {}
-        }
+        self.recording = False
+        self.writer = None
+        self.cv_writer = None  # cv2.VideoWriter reopened for each session
+        self.writer_fps = None
+        self.pending_frames = []
+        self.frame_size = None
+        self.resize_buf = None
+        self.session_path = None
+        self.part_path = None
+        self.confidence_path = None
+        self.confidence_log = None
+        self.archive = None
+        self.start_time = None
+        self.end_time = None
+        self.frame_count = 0
+        self.last_hash = None
+        self.dropped_frames = 0
+        self.queue_dropped_frames = 0
+        self.confidences = array("d")
+        self._reset_tallies()
+        self.timestamp = None
+        self.metadata = {}
+        self.photo_name = None
+        self.photo_ext = None
+        self.photo_params = None
+        self._store_frame = None
         
         os.makedirs(self.output_dir, exist_ok=True)
+        
+        self.frame_queue = None
+        if threaded:
+            self.frame_queue = queue.Queue(maxsize=8)
+            self.thread = threading.Thread(target=self._write_loop, daemon=True)
+            self.thread.start()
     
     def start(self) -> None:
         """Start a new recording session."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.state["timestamp"] = timestamp
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self.timestamp = timestamp
         
         if self.mode == RecorderMode.VIDEO:
             session_path = f"{self.output_dir}/cat_{timestamp}.{self.video_format}"
-            print(f"Started collecting frames for video: {session_path}")
+            # Frames are encoded as they arrive, then retimed into session_path
+            self.part_path = f"{self.output_dir}/cat_{timestamp}.part.{self.video_format}"
+            confidence_path = f"{session_path}.confidences.jsonl"
+            print(f"Started recording video: {session_path}")
+        elif Config.PHOTO_ARCHIVE:
+            # Photos, confidence log and metadata all end up in one tar file
+            session_path = f"{self.output_dir}/cat_photos_{timestamp}.tar"
+            self.archive = tarfile.open(session_path, "w")
+            confidence_path = f"{self.output_dir}/cat_photos_{timestamp}.confidences.jsonl"
+            print(f"Started collecting individual photos in: {session_path}")
         else:
             session_path = f"{self.output_dir}/cat_photos_{timestamp}"
-            os.makedirs(session_path, exist_ok=True)
+            # output_dir already exists, so a single mkdir is enough
+            try:
+                os.mkdir(session_path)
+            except FileExistsError:
+                pass
+            confidence_path = f"{session_path}/confidences.jsonl"
             print(f"Started collecting individual photos in: {session_path}")
         
-        self.state["frames"] = [] if self.mode == RecorderMode.VIDEO else None
-        self.state["frame_size"] = None
-        self.state["session_path"] = session_path
-        self.state["is_recording"] = True
-        self.state["start_time"] = time.time()
-        self.state["end_time"] = None
-        self.state["frame_count"] = 0
-        self.state["confidences"] = []
-        self.state["frame_sizes"] = []
-        self.state["metadata"] = {}
+        # Bind the mode's store method once, keeping mode checks out of the
+        # per-frame path
+        if self.mode == RecorderMode.VIDEO:
+            self._store_frame = self._store_video_frame
+        else:
+            self._store_frame = self._save_photo
+            # Photo settings are fixed for the session, format them once
+            self.photo_ext = f".{Config.PHOTO_FORMAT}"
+            self.photo_name = f"cat_%04d{self.photo_ext}".__mod__
+            is_jpeg = Config.PHOTO_FORMAT.lower() == 'jpg'
+            self.photo_params = [cv2.IMWRITE_JPEG_QUALITY, Config.PHOTO_QUALITY] if is_jpeg else []
+        
+        # Per-frame confidences are logged as they come, one JSON line each
+        self.confidence_path = confidence_path
+        self.confidence_log = open(confidence_path, "w")
+        
+        self.writer = None
+        self.writer_fps = None
+        self.pending_frames = []
+        self.frame_size = None
+        self.resize_buf = None
+        self.session_path = session_path
+        self.recording = True
+        self.start_time = time.time()
+        self.end_time = None
+        self.frame_count = 0
+        self.last_hash = None
+        self.dropped_frames = 0
+        self.queue_dropped_frames = 0
+        self.confidences = array("d")
+        self._reset_tallies()
+        self.metadata = {}
     
     def add_frame(self, frame: np.ndarray, cat_box: Tuple[int, int, int, int], confidence: float = 0.0) -> None:
         """Add a frame with cat to the current recording."""
-        if not self.state["is_recording"]:
+        if not self.recording:
             return
             
-        cropped_frame = self._crop_frame_to_cat(frame, cat_box)
+        # Video frames share the first frame's size, crop to it where possible
+        # (frame_size stays None for photos)
+        cropped_frame = self._crop_frame_to_cat(frame, cat_box, self.frame_size)
         
-        if self.state["frame_size"] is None:
-            self.state["frame_size"] = (cropped_frame.shape[1], cropped_frame.shape[0])
-        elif self.mode == RecorderMode.VIDEO:
-            cropped_frame = cv2.resize(cropped_frame, self.state["frame_size"])
+        if self.frame_queue is not None:
+            # The caller draws on the frame once this returns, so hand over
+            # a copy of the (much smaller) crop. Drop it rather than stall
+            # the capture loop if the writer falls far behind
+            try:
+                self.frame_queue.put((cropped_frame.copy(), confidence), timeout=1.0)
+            except queue.Full:
+                self.queue_dropped_frames += 1
+        else:
+            self._store_frame(cropped_frame, confidence)
+    
+    def _store_video_frame(self, cropped_frame: np.ndarray, confidence: float) -> None:
+        """Write a cropped frame to the video.
         
-        if self.mode == RecorderMode.VIDEO:
-            self.state["frames"].append(cropped_frame)
-            self.state["confidences"].append(confidence)
-            self.state["frame_sizes"].append(cropped_frame.nbytes)
+        The first Config.VIDEO_RATE_WINDOW seconds of frames are held back
+        to measure the frame rate the writer is opened at.
+        """
+        if self._skip_duplicate(cropped_frame):
+            return
+        
+        if self.frame_size is None:
+            self.frame_size = (cropped_frame.shape[1], cropped_frame.shape[0])
+            # Frames are written right away, so one resize buffer is enough
+            self.resize_buf = np.empty(cropped_frame.shape, dtype=cropped_frame.dtype)
+        elif cropped_frame.shape[1::-1] != self.frame_size:
+            cropped_frame = cv2.resize(
+                cropped_frame, self.frame_size, dst=self.resize_buf, interpolation=cv2.INTER_AREA
+            )
+        
+        if self.writer is not None:
+            self.writer.write(cropped_frame)
         else:
-            self._save_photo(cropped_frame, confidence)
+            # Held frames outlive the caller's frame and the resize buffer
+            self.pending_frames.append(cropped_frame.copy())
+            elapsed = time.time() - self.start_time
+            if elapsed >= Config.VIDEO_RATE_WINDOW:
+                self._open_video_writer(len(self.pending_frames) / elapsed)
+        self.frame_count += 1
+        # All video frames share one size, so the first one counts as largest
+        self._log_confidence(confidence)
+    
+    def _write_loop(self) -> None:
+        """Store queued frames until the shutdown sentinel arrives."""
+        # On Linux, pid 0 applies the affinity to this thread only
+        if Config.RECORDER_PIN_CORE is not None and hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, {Config.RECORDER_PIN_CORE})
+            except OSError as e:
+                print(f"Warning: could not pin the recorder to core {Config.RECORDER_PIN_CORE}: {e}")
+        while True:
+            item = self.frame_queue.get()
+            try:
+                if item is None:
+                    break
+                self._store_frame(*item)
+            except Exception as e:
+                # Keep the thread alive, the queue would fill up without it
+                print(f"Error storing recorded frame: {e}")
+            finally:
+                self.frame_queue.task_done()
+    
+    def _skip_duplicate(self, cropped_frame: np.ndarray) -> bool:
+        """Check if a frame looks the same as the last kept one, by dHash.
+        
+        The hash compares neighbouring pixels of a 9x8 grayscale thumbnail,
+        so it ignores small shifts in size and brightness. Frames found to
+        be duplicates are counted as dropped.
+        """
+        if Config.DUPLICATE_HASH_DISTANCE <= 0:
+            return False
+        
+        small = cv2.resize(cropped_frame, (9, 8), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        frame_hash = gray[:, 1:] > gray[:, :-1]
+        
+        last_hash = self.last_hash
+        if last_hash is not None and np.count_nonzero(frame_hash != last_hash) < Config.DUPLICATE_HASH_DISTANCE:
+            self.dropped_frames += 1
+            return True
+        self.last_hash = frame_hash
+        return False
+    
+    def _log_confidence(self, confidence: float) -> None:
+        """Record the confidence of a stored frame and append it to the log."""
+        index = len(self.confidences)
+        self.confidences.append(confidence)
+        
+        # Running summary (Welford's mean and variance), so stop() needs no scan
+        delta = confidence - self.confidence_mean
+        self.confidence_mean += delta / (index + 1)
+        self.confidence_m2 += delta * (confidence - self.confidence_mean)
+        self.confidence_min = min(self.confidence_min, confidence)
+        if confidence > self.confidence_max:
+            self.confidence_max = confidence
+            self.confidence_max_index = index
+        
+        self.confidence_log.write(json.dumps({"i": index, "c": confidence}) + "\n")
             
     def stop(self) -> None:
         """Stop recording and finalize output."""
-        if not self.state["is_recording"]:
+        if not self.recording:
             return
         
-        if self.state["end_time"] is None:
-            self.state["end_time"] = time.time()
+        # Let the writer thread store the frames still queued
+        if self.frame_queue is not None:
+            self.frame_queue.join()
+        self.confidence_log.close()
+        
+        if self.end_time is None:
+            self.end_time = time.time()
         
-        real_duration = self.state["end_time"] - self.state["start_time"]
+        real_duration = self.end_time - self.start_time
         print(f"Cat was visible for {real_duration:.2f} seconds")
         
         if self.mode == RecorderMode.VIDEO:
-            if self.state["frames"] and len(self.state["frames"]) > 0:
-                frame_count = len(self.state["frames"])
-                print(f"Creating video from {frame_count} frames...")
+            frame_count = self.frame_count
+            if frame_count > 0:
+                print(f"Finishing video of {frame_count} frames...")
                 
                 fps = frame_count / real_duration if real_duration > 0 else Config.DEFAULT_FPS
-                print(f"Setting video to {fps:.1f} FPS to match real-time duration")
                 
-                self._create_video(fps, real_duration)
-                self._save_video_metadata(frame_count, fps, real_duration)
+                stream_fps = self._finish_video(fps, real_duration)
+                self._save_video_metadata(frame_count, fps, stream_fps, real_duration)
             else:
                 print("No frames collected, video not created")
+                os.remove(self.confidence_path)
         else:
-            photo_count = self.state["frame_count"]
+            photo_count = self.frame_count
             if photo_count > 0:
-                print(f"Saved {photo_count} photos in: {self.state['session_path']}")
+                print(f"Saved {photo_count} photos in: {self.session_path}")
                 self._save_photos_metadata(photo_count, real_duration)
+                if self.archive is not None:
+                    self._close_archive()
             else:
                 print("No photos captured")
-                if os.path.exists(self.state["session_path"]):
+                # Nothing but the empty confidence log was written
+                os.remove(self.confidence_path)
+                if self.archive is not None:
+                    self.archive.close()
+                    os.remove(self.session_path)
+                else:
                     try:
-                        shutil.rmtree(self.state["session_path"])
-                        print(f"Removed empty directory: {self.state['session_path']}")
+                        os.rmdir(self.session_path)
+                        print(f"Removed empty directory: {self.session_path}")
                     except OSError:
                         pass
         
         self._reset_state()
     
+    def _close_archive(self) -> None:
+        """Move the confidence log into the photo archive and close it."""
+        confidence_path = self.confidence_path
+        self.archive.add(confidence_path, arcname=os.path.basename(confidence_path))
+        self.archive.close()
+        os.remove(confidence_path)
+    
+    def close(self) -> None:
+        """Stop the writer thread, if any, after storing the queued frames."""
+        if self.frame_queue is not None:
+            self.frame_queue.put(None)
+            self.thread.join()
+    
     def set_mode(self, mode: RecorderMode) -> None:
         """Change the recording mode."""
-        if self.state["is_recording"]:
+        if self.recording:
             print("Cannot change mode while recording is in progress")
             return
             
@@ -129,20 +418,24 @@ class CatRecorder:
     
     def is_recording(self) -> bool:
         """Check if recording is in progress."""
-        return self.state["is_recording"]
+        return self.recording
     
     def set_end_time(self, end_time: float) -> None:
         """Set the end time of the recording."""
-        self.state["end_time"] = end_time
+        self.end_time = end_time
     
-    def _crop_frame_to_cat(self, frame: np.ndarray, cat_box: Tuple[int, int, int, int]) -> np.ndarray:
-        """Crop the frame to the cat's bounding box with margin."""
+    def _crop_frame_to_cat(self, frame: np.ndarray, cat_box: Tuple[int, int, int, int], target_size: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """Crop the frame to the cat's bounding box with margin.
+        
+        With target_size, a crop that fits inside it is widened around the
+        cat to exactly that size, so it needs no resizing afterwards.
+        """
         x1, y1, x2, y2 = cat_box
         
         # Calculate margin (based on config percentage)
         w, h = x2 - x1, y2 - y1
-        margin_w = int(w * Config.CAT_MARGIN_PERCENT)
-        margin_h = int(h * Config.CAT_MARGIN_PERCENT)
+        margin_w = int(w * self.margin_percent)
+        margin_h = int(h * self.margin_percent)
         
         # Ensure margins don't go outside the frame
         frame_h, frame_w = frame.shape[:2]
@@ -151,123 +444,221 @@ class CatRecorder:
         x2 = min(frame_w, x2 + margin_w)
         y2 = min(frame_h, y2 + margin_h)
         
+        if target_size is not None:
+            x1, x2 = self._widen_span(x1, x2, target_size[0], frame_w)
+            y1, y2 = self._widen_span(y1, y2, target_size[1], frame_h)
+        
         return frame[y1:y2, x1:x2]
     
-    def _create_video(self, fps: float, real_duration: float) -> None:
-        """Create a video file from collected frames."""
-        fourcc = cv2.VideoWriter_fourcc(*self.codec)
-        out = cv2.VideoWriter(
-            self.state["session_path"],
-            fourcc,
-            fps,
-            self.state["frame_size"]
-        )
+    @staticmethod
+    def _widen_span(start: int, end: int, size: int, limit: int) -> Tuple[int, int]:
+        """Widen [start, end) to the given size inside [0, limit), if it fits."""
+        if end - start > size or size > limit:
+            return start, end
+        start = min(max(0, start - (size - (end - start)) // 2), limit - size)
+        return start, start + size
+    
+    def _open_video_writer(self, fps: float) -> None:
+        """Open the session's writer at the given FPS and write the held frames.
         
-        for frame in self.state["frames"]:
-            out.write(frame)
+        The exact frame rate is only known once recording stops, so the video
+        is retimed afterwards by _finish_video where ffmpeg is available.
+        """
+        encoder = _resolve_ffmpeg_encoder(Config.VIDEO_ENCODER)
+        if encoder is not None:
+            self.writer = _FfmpegWriter(self.part_path, encoder, fps, self.frame_size)
+        else:
+            # Reopen one writer instead of constructing a new one per session;
+            # open() takes codec, FPS and size, so it reinitializes as needed
+            if self.cv_writer is None:
+                self.cv_writer = cv2.VideoWriter()
+            self.cv_writer.open(self.part_path, self.fourcc, fps, self.frame_size)
+            self.writer = self.cv_writer
+        self.writer_fps = fps
         
-        out.release()
-        print(f"Finished saving video to {self.state['session_path']}")
-        print(f"Video duration: {len(self.state['frames'])/fps:.2f} seconds (should match {real_duration:.2f} seconds)")
+        for frame in self.pending_frames:
+            self.writer.write(frame)
+        self.pending_frames = []
+    
+    def _finish_video(self, fps: float, real_duration: float) -> Optional[float]:
+        """Close the writer and retime the written video to the given FPS.
+        
+        Retiming needs ffmpeg; without it, or if it fails, the video keeps
+        the frame rate measured over its first frames rather than being
+        encoded a second time, and the metadata records the real FPS.
+        Returns the FPS the saved video plays at, or None if no video was
+        written.
+        """
+        # Sessions shorter than the measuring window are encoded at their
+        # real rate in one go
+        if self.writer is None:
+            self._open_video_writer(fps)
+        self.writer.release()
+        self.writer = None
+        
+        part_path, session_path = self.part_path, self.session_path
+        if not os.path.exists(part_path):
+            print(f"Warning: no video was written to {session_path}")
+            return None
+        
+        stream_fps = self.writer_fps
+        if fps == stream_fps:
+            os.replace(part_path, session_path)
+        elif shutil.which("ffmpeg"):
+            # Rescale the timestamps only, copying the encoded stream as is
+            result = subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-itsscale", f"{stream_fps / fps}",
+                 "-i", part_path, "-c", "copy", session_path],
+                check=False
+            )
+            if result.returncode == 0:
+                os.remove(part_path)
+                stream_fps = fps
+                print(f"Set video to {fps:.1f} FPS to match real-time duration")
+            else:
+                print(f"Warning: ffmpeg exited with code {result.returncode} while retiming the video, "
+                      f"keeping it at {stream_fps:.1f} FPS")
+                os.replace(part_path, session_path)
+        else:
+            print(f"ffmpeg not found, keeping the video at its measured {stream_fps:.1f} FPS")
+            os.replace(part_path, session_path)
+        print(f"Finished saving video to {session_path}")
+        print(f"Video duration: {self.frame_count/stream_fps:.2f} seconds (real duration {real_duration:.2f} seconds)")
+        return stream_fps
     
     def _save_photo(self, frame: np.ndarray, confidence: float = 0.0) -> None:
-        """Save a single photo to the photos directory."""
-        filename = f"cat_{self.state['frame_count']:04d}.{Config.PHOTO_FORMAT}"
-        filepath = os.path.join(self.state["session_path"], filename)
-        
-        success = cv2.imwrite(
-            filepath, 
-            frame, 
-            [cv2.IMWRITE_JPEG_QUALITY, Config.PHOTO_QUALITY] if Config.PHOTO_FORMAT.lower() == 'jpg' else None
-        )
+        """Save a single photo to the photos directory or archive."""
+        if self._skip_duplicate(frame):
+            return
+        
+        filename = self.photo_name(self.frame_count)
+        
+        # Only JPEG photos have encoder params
+        if _turbo_jpeg is not None and self.photo_params:
+            encoded = _turbo_jpeg.encode(
+                np.ascontiguousarray(frame), quality=self.photo_params[1], pixel_format=TJPF_BGR
+            )
+            success = True
+        else:
+            success, encoded = cv2.imencode(self.photo_ext, frame, self.photo_params)
+            # Flat view of the encoded buffer, written without a bytes copy
+            encoded = encoded.reshape(-1).data if success else None
         
         if success:
-            self.state["confidences"].append(confidence)
-            self.state["frame_sizes"].append(frame.nbytes)
-            self.state["frame_count"] += 1
+            self._write_session_file(filename, encoded)
+            self._log_confidence(confidence)
+            if frame.nbytes > self.largest_frame_size:
+                self.largest_frame_size = frame.nbytes
+                self.largest_frame_index = self.frame_count
+            self.frame_count += 1
+    
+    def _write_session_file(self, filename: str, data: Union[bytes, memoryview]) -> None:
+        """Write a file into the photo session's directory or archive."""
+        archive = self.archive
+        if archive is not None:
+            info = tarfile.TarInfo(filename)
+            info.size = len(data)
+            info.mtime = time.time()
+            archive.addfile(info, io.BytesIO(data))
+        else:
+            with open(f"{self.session_path}/{filename}", "wb") as session_file:
+                session_file.write(data)
     
     def _reset_state(self) -> None:
         """Reset the recording state."""
-        self.state["frames"] = [] if self.mode == RecorderMode.VIDEO else None
-        self.state["frame_size"] = None
-        self.state["session_path"] = None
-        self.state["is_recording"] = False
-        self.state["start_time"] = None
-        self.state["end_time"] = None
-        self.state["frame_count"] = 0
-        self.state["confidences"] = []
-        self.state["frame_sizes"] = []
+        self.writer = None
+        self.writer_fps = None
+        self.pending_frames = []
+        self.frame_size = None
+        self.resize_buf = None
+        self.session_path = None
+        self.part_path = None
+        self.confidence_path = None
+        self.confidence_log = None
+        self.archive = None
+        self.recording = False
+        self.start_time = None
+        self.end_time = None
+        self.frame_count = 0
+        self.last_hash = None
+        self.dropped_frames = 0
+        self.queue_dropped_frames = 0
+        self.confidences = array("d")
+        self._reset_tallies()
+    
+    def _reset_tallies(self) -> None:
+        """Reset the running statistics of the stored frames."""
+        self.confidence_mean = 0.0
+        self.confidence_m2 = 0.0
+        self.confidence_min = float("inf")
+        self.confidence_max = float("-inf")
+        self.confidence_max_index = 0
+        self.largest_frame_size = 0
+        self.largest_frame_index = 0
     
     def _get_frame_statistics(self) -> Dict[str, Any]:
-        """Calculate statistics about recorded frames."""
-        if not self.state["confidences"]:
+        """Calculate statistics about recorded frames from the running tallies."""
+        confidences = self.confidences
+        if not confidences:
             return {}
-            
-        middle_idx = len(self.state["confidences"]) // 2
         
-        if self.state["frame_sizes"]:
-            largest_idx = self.state["frame_sizes"].index(max(self.state["frame_sizes"]))
-        else:
-            largest_idx = 0
-            
-        highest_conf_idx = self.state["confidences"].index(max(self.state["confidences"]))
+        middle_idx = len(confidences) // 2
+        largest_idx = self.largest_frame_index
         
         return {
             "middle_frame_index": middle_idx,
-            "middle_frame_confidence": self.state["confidences"][middle_idx],
+            "middle_frame_confidence": confidences[middle_idx],
             "largest_frame_index": largest_idx,
-            "largest_frame_confidence": self.state["confidences"][largest_idx],
-            "highest_confidence_frame_index": highest_conf_idx,
-            "highest_confidence_value": self.state["confidences"][highest_conf_idx],
+            "largest_frame_confidence": confidences[largest_idx],
+            "highest_confidence_frame_index": self.confidence_max_index,
+            "highest_confidence_value": self.confidence_max,
+            "confidence_mean": self.confidence_mean,
+            "confidence_std": (self.confidence_m2 / len(confidences)) ** 0.5,
+            "confidence_min": self.confidence_min,
         }
         
-    def _save_video_metadata(self, frame_count: int, fps: float, real_duration: float) -> None:
-        """Save metadata for the recorded video to a YAML file."""
-        frame_stats = self._get_frame_statistics()
-        
-        start_dt = datetime.fromtimestamp(self.state["start_time"])
-        end_dt = datetime.fromtimestamp(self.state["end_time"])
+    def _build_metadata(self, real_duration: float, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the metadata shared by video and photo sessions.
         
+        Args:
+            real_duration: Seconds the cat was visible
+            counts: Mode specific counts, listed right after the duration
+        """
         metadata = {
-            "date_time": start_dt.isoformat(),
-            "end_time": end_dt.isoformat(),
+            "date_time": datetime.fromtimestamp(self.start_time).isoformat(),
+            "end_time": datetime.fromtimestamp(self.end_time).isoformat(),
             "duration": real_duration,
-            "frame_count": frame_count,
-            "fps": fps,
-            "timestamp": self.state["timestamp"],
+            **counts,
+            "timestamp": self.timestamp,
+            "duplicate_frames_dropped": self.dropped_frames,
+            "queue_frames_dropped": self.queue_dropped_frames,
         }
         
-        metadata.update(frame_stats)
-        metadata["frame_confidences"] = self.state["confidences"]
+        metadata.update(self._get_frame_statistics())
+        metadata["frame_confidences_file"] = os.path.basename(self.confidence_path)
+        return metadata
+    
+    def _save_video_metadata(self, frame_count: int, fps: float, stream_fps: Optional[float], real_duration: float) -> None:
+        """Save metadata for the recorded video to a YAML file.
         
-        metadata_file = f"{self.state['session_path']}.yaml"
+        fps is the real capture rate, stream_fps the rate the file plays at.
+        """
+        metadata = self._build_metadata(
+            real_duration, {"frame_count": frame_count, "fps": fps, "stream_fps": stream_fps}
+        )
+        metadata_file = f"{self.session_path}.yaml"
         
         with open(metadata_file, "w") as yaml_file:
-            yaml.dump(metadata, yaml_file, default_flow_style=False, sort_keys=False)
+            yaml.dump(metadata, yaml_file, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         
         print(f"Metadata saved to: {metadata_file}")
     
     def _save_photos_metadata(self, photo_count: int, real_duration: float) -> None:
         """Save metadata for the captured photos to a YAML file."""
-        frame_stats = self._get_frame_statistics()
-        
-        start_dt = datetime.fromtimestamp(self.state["start_time"])
-        end_dt = datetime.fromtimestamp(self.state["end_time"])
+        metadata = self._build_metadata(real_duration, {"photo_count": photo_count})
+        metadata_file = f"{self.session_path}/metadata.yaml"
         
-        metadata = {
-            "date_time": start_dt.isoformat(),
-            "end_time": end_dt.isoformat(),
-            "duration": real_duration,
-            "photo_count": photo_count,
-            "timestamp": self.state["timestamp"],
-        }
-        
-        metadata.update(frame_stats)
-        metadata["frame_confidences"] = self.state["confidences"]
-        
-        metadata_file = f"{self.state['session_path']}/metadata.yaml"
-        
-        with open(metadata_file, "w") as yaml_file:
-            yaml.dump(metadata, yaml_file, default_flow_style=False, sort_keys=False)
+        text = yaml.dump(metadata, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        self._write_session_file("metadata.yaml", text.encode())
         
         print(f"Metadata saved to: {metadata_file}")
\ No newline at end of file
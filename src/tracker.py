@@ -1,11 +1,20 @@
 """Cat tracking module for monitoring cat presence and absence."""
 
 import time
-from typing import Dict, Any, Optional
+from typing import Optional, Tuple
+
+
+# (appeared, disappeared, duration, away_since) for one update; duration and
+# away_since are only set when the cat disappeared
+TrackerEvents = Tuple[bool, bool, Optional[float], Optional[float]]
 
 
 class CatTracker:
-    """Tracks cat presence and absence."""
+    """Tracks cat presence and absence.
+    
+    Times are read from time.monotonic(), so durations are unaffected by
+    wall clock adjustments.
+    """
     
     def __init__(self, absence_threshold: float):
         """Initialize cat tracker with timeout threshold."""
@@ -16,13 +25,15 @@ class CatTracker:
             "away_since": None
         }
     
-    def update(self, cat_detected: bool) -> Dict[str, Any]:
-        """Update tracking state based on current detection."""
-        events = {
-            "appeared": False,
-            "disappeared": False,
-            "duration": None
-        }
+    def update(self, cat_detected: bool, now: Optional[float] = None) -> TrackerEvents:
+        """Update tracking state based on current detection.
+        
+        Args:
+            cat_detected: Whether a cat is visible in the current frame
+            now: Current time.monotonic() value, read here if not given
+        """
+        if now is None:
+            now = time.monotonic()
         
         if cat_detected:
             # Cat is currently visible
@@ -31,26 +42,27 @@ class CatTracker:
             if not self.state["is_detected"]:
                 # Cat just appeared
                 self.state["is_detected"] = True
-                self.state["start_time"] = time.time()
-                events["appeared"] = True
+                self.state["start_time"] = now
+                return True, False, None, None
         else:
             # Cat is not visible in this frame
             if self.state["is_detected"]:
                 if self.state["away_since"] is None:
                     # Cat just disappeared, start tracking absence
-                    self.state["away_since"] = time.time()
-                elif time.time() - self.state["away_since"] >= self.absence_threshold:
+                    self.state["away_since"] = now
+                elif now - self.state["away_since"] >= self.absence_threshold:
                     # Cat has been away for threshold time
-                    events["disappeared"] = True
-                    events["duration"] = self.state["away_since"] - self.state["start_time"]
+                    away_since = self.state["away_since"]
+                    duration = away_since - self.state["start_time"]
                     self._reset()
+                    return False, True, duration, away_since
         
-        return events
+        return False, False, None, None
     
     def get_detection_time(self) -> Optional[float]:
         """Get how long the cat has been detected."""
         if self.state["is_detected"] and self.state["start_time"] is not None:
-            return time.time() - self.state["start_time"]
+            return time.monotonic() - self.state["start_time"]
         return None
     
     def is_detected(self) -> bool:
@@ -58,11 +70,11 @@ class CatTracker:
         return self.state["is_detected"]
     
     def get_start_time(self) -> Optional[float]:
-        """Get time when cat first appeared."""
+        """Get time.monotonic() value when cat first appeared."""
         return self.state["start_time"]
     
     def get_away_since(self) -> Optional[float]:
-        """Get time when cat started being away."""
+        """Get time.monotonic() value when cat started being away."""
         return self.state["away_since"]
     
     def _reset(self) -> None: